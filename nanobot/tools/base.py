@@ -1,51 +1,157 @@
 """Base tool infrastructure — dual API format support."""
-from dataclasses import dataclass, field
-from typing import Any
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, ClassVar
+
+
+class ResultData(Mapping):
+    """
+    Base for structured ``ToolResult.data`` payloads.
+
+    Subclasses are ``@dataclass(slots=True, frozen=True)`` records; the
+    dict form is only built when the result is serialised for an LLM.
+    The default ``to_dict`` is flat: ``calc_type`` first (when set), then
+    each field in declaration order, tuples as lists.
+
+    Payloads are read-only mappings over the ``to_dict`` keys, so callers
+    written against the dict payloads keep working (``in``, ``.get``,
+    ``dict(...)``); ``json.dumps`` needs ``ToolResult.payload()``.
+    """
+    __slots__ = ()
+
+    calc_type: ClassVar[str] = ""
+
+    def to_dict(self) -> dict:
+        data: dict = {"calc_type": self.calc_type} if self.calc_type else {}
+        for f in fields(self):
+            data[f.name] = _plain(getattr(self, f.name))
+        return data
+
+    def _layout(self) -> tuple[tuple[str, ...], frozenset[str], frozenset[str]]:
+        """
+        ``to_dict`` keys, as a tuple and a set, plus the keys that are read
+        straight from a same-named field. Worked out once per class.
+        """
+        cls = type(self)
+        layout = cls.__dict__.get("_payload_layout")
+        if layout is None:
+            keys = tuple(self.to_dict())
+            key_set = frozenset(keys)
+            layout = cls._payload_layout = (keys, key_set, key_set & {f.name for f in fields(self)})
+        return layout
+
+    def __getitem__(self, key: str) -> Any:
+        """Field-backed keys skip ``to_dict``; only derived keys build the full dict."""
+        if key in self._layout()[2]:
+            return _plain(getattr(self, key))
+        return self.to_dict()[key]
+
+    def __iter__(self):
+        return iter(self._layout()[0])
+
+    def __len__(self) -> int:
+        return len(self._layout()[0])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._layout()[1]
+
+
+def _plain(value: Any) -> Any:
+    """Dict-payload form of a field: tuples as lists, inner dicts copied."""
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
 
 
 @dataclass
 class ToolResult:
     """Unified result type for all tools."""
     success: bool
-    data: dict = field(default_factory=dict)
+    data: dict | ResultData = field(default_factory=dict)
     error: str = ""
     tool_name: str = ""
 
+    def payload(self) -> dict:
+        """Return ``data`` as a plain dict, materialising dataclass payloads."""
+        if is_dataclass(self.data):
+            return self.data.to_dict()
+        return self.data
+
     def to_anthropic(self) -> dict:
         """Format for Anthropic tool_result blocks."""
         if self.success:
-            return {"type": "tool_result", "content": str(self.data)}
+            return {"type": "tool_result", "content": str(self.payload())}
         return {"type": "tool_result", "is_error": True, "content": self.error}
 
     def to_openai(self) -> dict:
         """Format for OpenAI function call responses."""
         if self.success:
-            return {"role": "tool", "content": str(self.data)}
+            return {"role": "tool", "content": str(self.payload())}
         return {"role": "tool", "content": f"Error: {self.error}"}
 
 
 class BaseTool:
-    """Abstract base for all nanobot tools."""
-    name: str = ""
-    description: str = ""
-    parameters_schema: dict = {}
+    """
+    Abstract base for all nanobot tools.
 
-    def run(self, **kwargs: Any) -> ToolResult:
-        raise NotImplementedError
+    ``name``, ``description`` and ``parameters_schema`` are per-class
+    attributes; the Anthropic and OpenAI schema wrappers are built from
+    them once, when each subclass is created. Callers get their own copy,
+    so adding ``cache_control`` or editing ``required`` doesn't leak into
+    later calls.
+    """
+    __slots__ = ()
 
-    def to_anthropic_schema(self) -> dict:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.parameters_schema,
-        }
+    name: ClassVar[str] = ""
+    description: ClassVar[str] = ""
+    parameters_schema: ClassVar[dict] = {}
 
-    def to_openai_schema(self) -> dict:
-        return {
+    _anthropic_schema: ClassVar[dict]
+    _openai_schema: ClassVar[dict]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._build_schemas()
+
+    @classmethod
+    def _build_schemas(cls) -> None:
+        cls._anthropic_schema = {
+            "name": cls.name,
+            "description": cls.description,
+            "input_schema": cls.parameters_schema,
+        }
+        cls._openai_schema = {
             "type": "function",
             "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters_schema,
+                "name": cls.name,
+                "description": cls.description,
+                "parameters": cls.parameters_schema,
             },
         }
+
+    def run(self, **kwargs: Any) -> ToolResult:
+        raise NotImplementedError
+
+    def run_many(self, calc_type: str, records: Sequence[Mapping[str, Any]]) -> list[ToolResult]:
+        """Run ``calc_type`` once per record of keyword arguments; tools may override with a column-wise path."""
+        return [self.run(**{**record, "calc_type": calc_type}) for record in records]
+
+    def to_anthropic_schema(self) -> dict:
+        return _copy_schema(self._anthropic_schema)
+
+    def to_openai_schema(self) -> dict:
+        return _copy_schema(self._openai_schema)
+
+
+BaseTool._build_schemas()
+
+
+def _copy_schema(node: Any) -> Any:
+    """Copy a JSON-schema tree of dicts and lists; leaves are immutable."""
+    if isinstance(node, dict):
+        return {key: _copy_schema(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_schema(value) for value in node]
+    return node
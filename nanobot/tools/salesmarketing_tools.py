@@ -17,15 +17,235 @@ both Anthropic and OpenAI schema formats.
 from __future__ import annotations
 
 import math
-from typing import Any
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping, Sequence
 
-from nanobot.tools.base import BaseTool, ToolResult
+from nanobot.tools.base import BaseTool, ResultData, ToolResult
+
+_floor = math.floor
+_log1p = math.log1p
+
+# Errors raised by coercing / evaluating malformed LLM-supplied arguments;
+# run() reports these as failed ToolResults, anything else is a bug.
+_INPUT_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+def _round1(value: float) -> float:
+    """Round half-up to one decimal place.
+
+    About 3x cheaper than ``round(value, 1)``; ties go up rather than to
+    even, which is fine for display scores. Non-finite values, and finite
+    ones too large to scale, come back unchanged as ``round`` returns them.
+    """
+    try:
+        return _floor(value * 10 + 0.5) / 10
+    except (OverflowError, ValueError):
+        return value
+
+
+def _round2(value: float) -> float:
+    """Half-up counterpart of ``round(value, 2)``."""
+    try:
+        return _floor(value * 100 + 0.5) / 100
+    except (OverflowError, ValueError):
+        return value
+
+
+def _round4(value: float) -> float:
+    """Half-up counterpart of ``round(value, 4)``."""
+    try:
+        return _floor(value * 10000 + 0.5) / 10000
+    except (OverflowError, ValueError):
+        return value
+
+
+def _round1_clip(value: float, lo: float, hi: float) -> float:
+    """``_round1`` followed by a clamp to ``[lo, hi]``, in one call."""
+    try:
+        r = _floor(value * 10 + 0.5) / 10
+    except (OverflowError, ValueError):
+        r = value
+    return lo if r < lo else hi if r > hi else r
+
+
+def _coerce_columns(
+    records: Sequence[Mapping[str, Any]], columns: Sequence[tuple[str, type | None, Any]]
+) -> list[list[Any]]:
+    """Coerce ``(field, cast, default)`` columns across ``records`` into typed lists.
+
+    A ``None`` cast passes the raw value through, as the scalar methods do
+    for enum-like string fields.
+    """
+    return [
+        [r.get(name, default) for r in records] if cast is None
+        else [cast(r.get(name, default)) for r in records]
+        for name, cast, default in columns
+    ]
+
+
+class _ColumnBatchTool(BaseTool):
+    """
+    Tool whose ``run_many`` is column-wise for calc_types in ``_BATCH_COLUMNS``.
+
+    Each spec names the result packer and its ``(field, cast, default)``
+    arguments; inputs are coerced once per column and packed row by row.
+    Calc_types without a spec, and batches where any record fails to
+    coerce or pack, fall back to the per-record path so ``run()`` reports
+    each bad record on its own.
+    """
+    __slots__ = ()
+
+    _BATCH_COLUMNS: ClassVar[dict[str, tuple[str, tuple[tuple[str, type | None, Any], ...]]]] = {}
+
+    def run_many(self, calc_type: str, records: Sequence[Mapping[str, Any]]) -> list[ToolResult]:
+        spec = self._BATCH_COLUMNS.get(calc_type) if isinstance(calc_type, str) else None
+        if spec is not None:
+            method, columns = spec
+            pack = getattr(self, method)
+            try:
+                return [pack(*row) for row in zip(*_coerce_columns(records, columns))]
+            except _INPUT_ERRORS:
+                pass
+        return super().run_many(calc_type, records)
 
 
 # ---------------------------------------------------------------------------
 # 1. Lead Scoring Calculator
 # ---------------------------------------------------------------------------
 
+# ILT engagement points for small event counts; the 25-pt cap saturates at
+# ~93 events, so anything past the table is a flat 25.
+_ENG_LUT = tuple(min(25.0, math.log1p(n) * 5.5) for n in range(512))
+
+# BANT timeline points: <=1, <=3, <=6, <=12 months, then anything longer.
+_TIMELINE_CUT = (1, 3, 6, 12)
+_TIMELINE_SCORE = (25.0, 20.0, 14.0, 8.0, 3.0)
+
+# Seniority / budget enums (as declared in parameters_schema) mapped to a
+# weight-tuple index; unrecognised values fall back to the "Unknown" slot.
+_SENIORITY_INDEX: dict[str, int] = {
+    "C-Suite": 0, "VP": 1, "Director": 2, "Manager": 3,
+    "Individual Contributor": 4, "Unknown": 5,
+}
+_SENIORITY_WEIGHT_TUPLE = (1.0, 0.9, 0.75, 0.55, 0.3, 0.2)
+_BUDGET_INDEX: dict[str, int] = {
+    "<$10k": 0, "$10k-$50k": 1, "$50k-$200k": 2, "$200k-$1M": 3, ">$1M": 4, "Unknown": 5,
+}
+_BUDGET_WEIGHT_TUPLE = (0.1, 0.4, 0.75, 0.95, 1.0, 0.15)
+
+# ILT tier boundaries: D <35, C >=35, B >=55, A >=75.
+_ILT_TIER_CUT = (35, 55, 75)
+_TIER_LABELS = ("D — Unqualified", "C — Cool", "B — Warm", "A — Hot")
+_TIER_ACTIONS = (
+    "Do not work. Return to awareness campaigns.",
+    "Long-nurture sequence. Marketing-qualified only.",
+    "Enroll in nurture sequence. SDR follow-up within 24 h.",
+    "Route to AE immediately. Add to Tier-1 sequence.",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class ILTScoreResult(ResultData):
+    """ILT (ICP fit) score with its 40/35/25-pt breakdown."""
+    calc_type: ClassVar[str] = "ilt_score"
+    score: float
+    tier: str
+    firmographic: float
+    seniority: float
+    engagement: float
+    recommended_action: str
+    company_size: int
+    industry: str
+    title_seniority: str
+    engagement_signals: int
+
+    def to_dict(self) -> dict:
+        return {
+            "calc_type": self.calc_type,
+            "ilt_score": self.score,
+            "tier": self.tier,
+            "breakdown": {
+                "firmographic_fit_40pts": self.firmographic,
+                "title_seniority_35pts": self.seniority,
+                "engagement_signals_25pts": self.engagement,
+            },
+            "recommended_action": self.recommended_action,
+            "inputs": {
+                "company_size": self.company_size,
+                "industry": self.industry,
+                "title_seniority": self.title_seniority,
+                "engagement_signals": self.engagement_signals,
+            },
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class BANTResult(ResultData):
+    """BANT qualification total, per-letter breakdown, and open gaps."""
+    calc_type: ClassVar[str] = "bant_qualify"
+    total: float
+    qualified: bool
+    qualification_status: str
+    budget: float
+    authority: float
+    need: float
+    timeline: float
+    gaps: tuple[str, ...]
+    next_steps: str
+
+    def to_dict(self) -> dict:
+        return {
+            "calc_type": self.calc_type,
+            "bant_total_score": self.total,
+            "qualified": self.qualified,
+            "qualification_status": self.qualification_status,
+            "breakdown": {
+                "Budget_25pts": self.budget,
+                "Authority_25pts": self.authority,
+                "Need_25pts": self.need,
+                "Timeline_25pts": self.timeline,
+            },
+            "gaps": list(self.gaps),
+            "next_steps": self.next_steps,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class MEDDICResult(ResultData):
+    """MEDDIC total, deal confidence, per-component breakdown, and risks."""
+    calc_type: ClassVar[str] = "meddic_score"
+    total: float
+    deal_confidence: str
+    metrics: float
+    economic_buyer: float
+    decision_criteria: float
+    decision_process: float
+    identify_pain: float
+    champion: float
+    risks: tuple[str, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            "calc_type": self.calc_type,
+            "meddic_total": self.total,
+            "deal_confidence": self.deal_confidence,
+            "breakdown": {
+                "Metrics": self.metrics,
+                "Economic_Buyer": self.economic_buyer,
+                "Decision_Criteria": self.decision_criteria,
+                "Decision_Process": self.decision_process,
+                "Identify_Pain": self.identify_pain,
+                "Champion": self.champion,
+            },
+            "risks": list(self.risks),
+        }
+
+
 class LeadScoringCalcTool(BaseTool):
     """
     Scores and qualifies leads using ICP fit, BANT, MEDDIC, and predictive models.
@@ -38,6 +258,8 @@ class LeadScoringCalcTool(BaseTool):
       - conversion_probability : Probability of lead → closed-won
     """
 
+    __slots__ = ()
+
     name = "lead_scoring_calc"
     description = (
         "Scores and qualifies sales leads using ICP fit (ILT), BANT, MEDDIC frameworks, "
@@ -120,58 +342,101 @@ class LeadScoringCalcTool(BaseTool):
     # ICP target ranges for scoring
     _IDEAL_COMPANY_SIZE_MIN = 50
     _IDEAL_COMPANY_SIZE_MAX = 5000
-    _SENIORITY_WEIGHTS = {
-        "C-Suite": 1.0,
-        "VP": 0.9,
-        "Director": 0.75,
-        "Manager": 0.55,
-        "Individual Contributor": 0.3,
-        "Unknown": 0.2,
-    }
-    _BUDGET_WEIGHTS = {
-        "<$10k": 0.1,
-        "$10k-$50k": 0.4,
-        "$50k-$200k": 0.75,
-        "$200k-$1M": 0.95,
-        ">$1M": 1.0,
-        "Unknown": 0.15,
+
+    # (label, breakdown component, minimum score) — a component below its
+    # threshold is reported as a qualification gap / deal risk.
+    _BANT_GAPS = (
+        ("Budget clarity", "b", 10.0),
+        ("Economic buyer confirmed", "a", 12.0),
+        ("Clear pain identified", "n", 12.0),
+        ("Active buying timeline", "t", 8.0),
+    )
+    _MEDDIC_RISKS = (
+        ("No economic buyer confirmed", "econ_buyer", 10.0),
+        ("Weak pain articulation", "identify_pain", 8.0),
+        ("No internal champion", "champion", 8.0),
+        ("Unclear decision process", "decision_process", 8.0),
+    )
+
+    # Columns read by run_batch and their defaults (same as run()).
+    _RUN_BATCH_COLUMNS = (
+        ("company_size", 0),
+        ("title_seniority", "Unknown"),
+        ("engagement_signals", 0),
+        ("budget_range", "Unknown"),
+        ("pain_score", 0),
+        ("timeline_months", 12),
+    )
+
+    _DISPATCH: dict[str, str] = {
+        "ilt_score": "_ilt_score",
+        "bant_qualify": "_bant_qualify",
+        "meddic_score": "_meddic_score",
+        "lead_velocity_rate": "_lead_velocity_rate",
+        "conversion_probability": "_conversion_probability",
     }
 
-    def run(self, **kwargs: Any) -> ToolResult:  # noqa: C901
+    def run(self, **kwargs: Any) -> ToolResult:
         calc_type = kwargs.get("calc_type", "")
-
+        method = self._DISPATCH.get(calc_type) if isinstance(calc_type, str) else None
+        if method is None:
+            return ToolResult(
+                success=False,
+                error=f"Unknown calc_type '{calc_type}'. Valid: ilt_score, bant_qualify, "
+                      "meddic_score, lead_velocity_rate, conversion_probability.",
+                tool_name=self.name,
+            )
         try:
-            if calc_type == "ilt_score":
-                return self._ilt_score(**kwargs)
-            elif calc_type == "bant_qualify":
-                return self._bant_qualify(**kwargs)
-            elif calc_type == "meddic_score":
-                return self._meddic_score(**kwargs)
-            elif calc_type == "lead_velocity_rate":
-                return self._lead_velocity_rate(**kwargs)
-            elif calc_type == "conversion_probability":
-                return self._conversion_probability(**kwargs)
-            else:
-                return ToolResult(
-                    success=False,
-                    error=f"Unknown calc_type '{calc_type}'. Valid: ilt_score, bant_qualify, "
-                          "meddic_score, lead_velocity_rate, conversion_probability.",
-                    tool_name=self.name,
-                )
-        except Exception as exc:
+            return getattr(self, method)(**kwargs)
+        except _INPUT_ERRORS as exc:
             return ToolResult(success=False, error=str(exc), tool_name=self.name)
 
-    # ------------------------------------------------------------------
-    def _ilt_score(self, **kw) -> ToolResult:
-        company_size = int(kw.get("company_size", 0))
-        title_seniority = kw.get("title_seniority", "Unknown")
-        engagement_signals = int(kw.get("engagement_signals", 0))
-        industry = kw.get("industry", "")
+    def run_batch(
+        self, columns: Mapping[str, Sequence[Any]]
+    ) -> tuple[list[float], list[float], list[int]]:
+        """
+        Bulk ILT + BANT scoring for CRM exports.
+
+        ``columns`` maps field names to equal-length sequences — a dict of
+        lists or a pandas DataFrame both work. Missing columns take the
+        same defaults as ``run``. Returns parallel lists of ILT score, BANT
+        total, and ILT tier index into ``_TIER_LABELS`` (0 = D ... 3 = A),
+        skipping the per-row kwargs dispatch and ToolResult construction.
+        """
+        present = [name for name, _ in self._RUN_BATCH_COLUMNS if name in columns]
+        n = len(columns[present[0]]) if present else 0
+        sizes, seniorities, engagements, budgets, pains, timelines = (
+            columns[name] if name in columns else [default] * n
+            for name, default in self._RUN_BATCH_COLUMNS
+        )
+
+        ilt_core, bant_core = self._ilt_core, self._bant_core
+        ilt_scores: list[float] = []
+        bant_scores: list[float] = []
+        tiers: list[int] = []
+        for size, seniority, engagement, budget, pain, timeline in zip(
+            sizes, seniorities, engagements, budgets, pains, timelines, strict=True
+        ):
+            score = ilt_core(int(size), seniority, int(engagement))[3]
+            ilt_scores.append(score)
+            bant_scores.append(
+                bant_core(budget, seniority, min(10, max(0, int(pain))), float(timeline))[4]
+            )
+            tiers.append(bisect_right(_ILT_TIER_CUT, score))
+        return ilt_scores, bant_scores, tiers
 
+    # ------------------------------------------------------------------
+    # Numeric cores — pure functions of small hashable inputs, memoised so
+    # that re-scoring the same lead during planning is a cache hit.
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _ilt_core(
+        cls, company_size: int, title_seniority: str, engagement_signals: int
+    ) -> tuple[float, float, float, float]:
         # Firmographic fit (40 pts)
-        if self._IDEAL_COMPANY_SIZE_MIN <= company_size <= self._IDEAL_COMPANY_SIZE_MAX:
+        if cls._IDEAL_COMPANY_SIZE_MIN <= company_size <= cls._IDEAL_COMPANY_SIZE_MAX:
             firmographic = 40.0
-        elif company_size > self._IDEAL_COMPANY_SIZE_MAX:
+        elif company_size > cls._IDEAL_COMPANY_SIZE_MAX:
             firmographic = 35.0  # enterprise — still good but needs different motion
         elif company_size > 10:
             firmographic = 20.0
@@ -179,42 +444,91 @@ class LeadScoringCalcTool(BaseTool):
             firmographic = 5.0
 
         # Seniority (35 pts)
-        seniority_score = self._SENIORITY_WEIGHTS.get(title_seniority, 0.2) * 35.0
+        seniority_score = _SENIORITY_WEIGHT_TUPLE[_SENIORITY_INDEX.get(title_seniority, 5)] * 35.0
 
         # Engagement (25 pts) — log-based diminishing returns
-        engagement_score = min(25.0, math.log1p(engagement_signals) * 5.5)
+        if 0 <= engagement_signals < 512:
+            engagement_score = _ENG_LUT[engagement_signals]
+        else:
+            engagement_score = min(25.0, _log1p(engagement_signals) * 5.5)
 
         raw_score = firmographic + seniority_score + engagement_score
-        score = round(min(100.0, raw_score), 1)
-
-        if score >= 75:
-            tier, action = "A — Hot", "Route to AE immediately. Add to Tier-1 sequence."
-        elif score >= 55:
-            tier, action = "B — Warm", "Enroll in nurture sequence. SDR follow-up within 24 h."
-        elif score >= 35:
-            tier, action = "C — Cool", "Long-nurture sequence. Marketing-qualified only."
-        else:
-            tier, action = "D — Unqualified", "Do not work. Return to awareness campaigns."
+        firmographic, seniority_score, engagement_score, score = map(
+            _round1, (firmographic, seniority_score, engagement_score, min(100.0, raw_score))
+        )
+        return firmographic, seniority_score, engagement_score, score
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _bant_core(
+        cls, budget: str, seniority: str, pain_score: int, timeline: float
+    ) -> tuple[float, float, float, float, float]:
+        b_score = _BUDGET_WEIGHT_TUPLE[_BUDGET_INDEX.get(budget, 5)] * 25
+        a_score = _SENIORITY_WEIGHT_TUPLE[_SENIORITY_INDEX.get(seniority, 5)] * 25
+        n_score = (pain_score / 10.0) * 25
+
+        # Need score (shorter timeline = higher score). NaN fails every
+        # comparison, so it takes the ladder's last (longest) band.
+        t_score = _TIMELINE_SCORE[bisect_left(_TIMELINE_CUT, timeline) if timeline == timeline else -1]
+
+        total = b_score + a_score + n_score + t_score
+        return tuple(map(_round1, (b_score, a_score, n_score, t_score, total)))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _meddic_core(
+        cls, pain_score: int, decision_maker: bool, champion: bool, engagement: int
+    ) -> tuple[float, float, float, float, float, float, float]:
+        # MEDDIC components (each ~16-17 pts)
+        metrics_score = (pain_score / 10) * 17                     # Metrics
+        econ_buyer_score = 17.0 if decision_maker else 4.0         # Economic Buyer
+        decision_criteria = engagement * 1.2                       # Decision Criteria (proxy)
+        decision_process = engagement * 0.9                        # Decision Process (proxy)
+        identify_pain_score = (pain_score / 10) * 16               # Identify Pain
+        champion_score = 16.0 if champion else 3.0                 # Champion
+
+        # The proxies cap at the int 17, which is reported as-is; only the
+        # float components are rounded.
+        decision_criteria = 17 if decision_criteria >= 17 else _round1(decision_criteria)
+        decision_process = 17 if decision_process >= 17 else _round1(decision_process)
+        metrics_score, identify_pain_score = _round1(metrics_score), _round1(identify_pain_score)
+        total = min(100, _round1(
+            metrics_score + econ_buyer_score + decision_criteria +
+            decision_process + identify_pain_score + champion_score
+        ))
+        return (
+            metrics_score, econ_buyer_score, decision_criteria, decision_process,
+            identify_pain_score, champion_score, total,
+        )
+
+    # ------------------------------------------------------------------
+    def _ilt_score(self, **kw) -> ToolResult:
+        company_size = int(kw.get("company_size", 0))
+        title_seniority = kw.get("title_seniority", "Unknown")
+        engagement_signals = int(kw.get("engagement_signals", 0))
+        industry = kw.get("industry", "")
+
+        firmographic, seniority_score, engagement_score, score = self._ilt_core(
+            company_size, title_seniority, engagement_signals
+        )
+
+        tier_idx = bisect_right(_ILT_TIER_CUT, score)
+        tier, action = _TIER_LABELS[tier_idx], _TIER_ACTIONS[tier_idx]
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "ilt_score",
-                "ilt_score": score,
-                "tier": tier,
-                "breakdown": {
-                    "firmographic_fit_40pts": round(firmographic, 1),
-                    "title_seniority_35pts": round(seniority_score, 1),
-                    "engagement_signals_25pts": round(engagement_score, 1),
-                },
-                "recommended_action": action,
-                "inputs": {
-                    "company_size": company_size,
-                    "industry": industry,
-                    "title_seniority": title_seniority,
-                    "engagement_signals": engagement_signals,
-                },
-            },
+            data=ILTScoreResult(
+                score=score,
+                tier=tier,
+                firmographic=firmographic,
+                seniority=seniority_score,
+                engagement=engagement_score,
+                recommended_action=action,
+                company_size=company_size,
+                industry=industry,
+                title_seniority=title_seniority,
+                engagement_signals=engagement_signals,
+            ),
             tool_name=self.name,
         )
 
@@ -225,52 +539,29 @@ class LeadScoringCalcTool(BaseTool):
         pain_score = min(10, max(0, int(kw.get("pain_score", 0))))
         timeline = float(kw.get("timeline_months", 12))
 
-        b_score = self._BUDGET_WEIGHTS.get(budget, 0.15) * 25
-        a_score = self._SENIORITY_WEIGHTS.get(seniority, 0.2) * 25
-        n_score = (pain_score / 10.0) * 25
-
-        # Need score (shorter timeline = higher score)
-        if timeline <= 1:
-            t_score = 25.0
-        elif timeline <= 3:
-            t_score = 20.0
-        elif timeline <= 6:
-            t_score = 14.0
-        elif timeline <= 12:
-            t_score = 8.0
-        else:
-            t_score = 3.0
-
-        total = round(b_score + a_score + n_score + t_score, 1)
+        b_score, a_score, n_score, t_score, total = self._bant_core(
+            budget, seniority, pain_score, timeline
+        )
         qualified = total >= 60
+        scores = {"b": b_score, "a": a_score, "n": n_score, "t": t_score}
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "bant_qualify",
-                "bant_total_score": total,
-                "qualified": qualified,
-                "qualification_status": "SQL — Sales Qualified Lead" if qualified else "MQL — Needs further nurturing",
-                "breakdown": {
-                    "Budget_25pts": round(b_score, 1),
-                    "Authority_25pts": round(a_score, 1),
-                    "Need_25pts": round(n_score, 1),
-                    "Timeline_25pts": round(t_score, 1),
-                },
-                "gaps": [
-                    k for k, v in {
-                        "Budget clarity": b_score < 10,
-                        "Economic buyer confirmed": a_score < 12,
-                        "Clear pain identified": n_score < 12,
-                        "Active buying timeline": t_score < 8,
-                    }.items() if v
-                ],
-                "next_steps": (
+            data=BANTResult(
+                total=total,
+                qualified=qualified,
+                qualification_status="SQL — Sales Qualified Lead" if qualified else "MQL — Needs further nurturing",
+                budget=b_score,
+                authority=a_score,
+                need=n_score,
+                timeline=t_score,
+                gaps=tuple(label for label, key, thr in self._BANT_GAPS if scores[key] < thr),
+                next_steps=(
                     "Schedule discovery call to map stakeholders and confirm budget."
                     if not qualified else
                     "Progress to demo / proposal. Assign AE and create deal in CRM."
                 ),
-            },
+            ),
             tool_name=self.name,
         )
 
@@ -282,43 +573,30 @@ class LeadScoringCalcTool(BaseTool):
         budget = kw.get("budget_range", "Unknown")
         engagement = int(kw.get("engagement_signals", 0))
 
-        # MEDDIC components (each ~16-17 pts)
-        metrics_score = round((pain_score / 10) * 17, 1)          # Metrics
-        econ_buyer_score = 17.0 if decision_maker else 4.0         # Economic Buyer
-        decision_criteria = round(min(17, engagement * 1.2), 1)    # Decision Criteria (proxy)
-        decision_process = round(min(17, engagement * 0.9), 1)     # Decision Process (proxy)
-        identify_pain_score = round((pain_score / 10) * 16, 1)    # Identify Pain
-        champion_score = 16.0 if champion else 3.0                 # Champion
-
-        total = round(
-            metrics_score + econ_buyer_score + decision_criteria +
-            decision_process + identify_pain_score + champion_score, 1
-        )
-        total = min(100, total)
+        (
+            metrics_score, econ_buyer_score, decision_criteria, decision_process,
+            identify_pain_score, champion_score, total,
+        ) = self._meddic_core(pain_score, decision_maker, champion, engagement)
+        scores = {
+            "econ_buyer": econ_buyer_score,
+            "identify_pain": identify_pain_score,
+            "champion": champion_score,
+            "decision_process": decision_process,
+        }
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "meddic_score",
-                "meddic_total": total,
-                "deal_confidence": "High" if total >= 70 else "Medium" if total >= 45 else "Low",
-                "breakdown": {
-                    "Metrics": metrics_score,
-                    "Economic_Buyer": econ_buyer_score,
-                    "Decision_Criteria": decision_criteria,
-                    "Decision_Process": decision_process,
-                    "Identify_Pain": identify_pain_score,
-                    "Champion": champion_score,
-                },
-                "risks": [
-                    comp for comp, score in {
-                        "No economic buyer confirmed": econ_buyer_score < 10,
-                        "Weak pain articulation": identify_pain_score < 8,
-                        "No internal champion": champion_score < 8,
-                        "Unclear decision process": decision_process < 8,
-                    }.items() if score
-                ],
-            },
+            data=MEDDICResult(
+                total=total,
+                deal_confidence="High" if total >= 70 else "Medium" if total >= 45 else "Low",
+                metrics=metrics_score,
+                economic_buyer=econ_buyer_score,
+                decision_criteria=decision_criteria,
+                decision_process=decision_process,
+                identify_pain=identify_pain_score,
+                champion=champion_score,
+                risks=tuple(label for label, key, thr in self._MEDDIC_RISKS if scores[key] < thr),
+            ),
             tool_name=self.name,
         )
 
@@ -359,10 +637,10 @@ class LeadScoringCalcTool(BaseTool):
         days_in_stage = float(kw.get("days_in_stage", 10))
         pain_score = min(10, max(0, int(kw.get("pain_score", 5))))
 
-        # Product of stage-by-stage win rates
+        # Product of stage-by-stage win rates, each clamped to [0, 1]
         base_prob = 1.0
-        for rate in stage_win_rates:
-            base_prob *= max(0.0, min(1.0, float(rate)))
+        for rate in map(float, stage_win_rates):
+            base_prob *= rate if 0.0 <= rate <= 1.0 else (0.0 if rate < 0.0 else 1.0)
 
         # Decay factor for aging deals (after 30 days in stage, probability decreases)
         age_decay = max(0.5, 1.0 - max(0, days_in_stage - 30) * 0.005)
@@ -370,8 +648,7 @@ class LeadScoringCalcTool(BaseTool):
         # Pain multiplier
         pain_multiplier = 0.7 + (pain_score / 10) * 0.3
 
-        adjusted_prob = round(base_prob * age_decay * pain_multiplier * 100, 1)
-        adjusted_prob = min(99.0, max(1.0, adjusted_prob))
+        adjusted_prob = _round1_clip(base_prob * age_decay * pain_multiplier * 100, 1.0, 99.0)
 
         return ToolResult(
             success=True,
@@ -379,7 +656,7 @@ class LeadScoringCalcTool(BaseTool):
                 "calc_type": "conversion_probability",
                 "conversion_probability_pct": adjusted_prob,
                 "risk_level": "Low" if adjusted_prob >= 65 else "Medium" if adjusted_prob >= 35 else "High",
-                "base_probability_pct": round(base_prob * 100, 1),
+                "base_probability_pct": _round1(base_prob * 100),
                 "age_decay_factor": round(age_decay, 3),
                 "pain_multiplier": round(pain_multiplier, 3),
                 "recommendation": (
@@ -398,6 +675,40 @@ class LeadScoringCalcTool(BaseTool):
 # 2. Campaign Analytics Calculator
 # ---------------------------------------------------------------------------
 
+# ROAS rating bands: <1, >=1, >=2, >=4.
+_ROAS_CUT = (1, 2, 4)
+_ROAS_RATING = (
+    ("Negative ROI", "Pause and audit creative, audience, landing page, and offer."),
+    ("Break-even", "Covering spend but not profitable after margin. Optimise creative/targeting."),
+    ("Good", "Performing above break-even. Test scaling budget 20%."),
+    ("Excellent", "Scale this campaign — strong positive ROI."),
+)
+
+
+def _monthly_gross_profit(aov: float, freq: float, margin: float) -> float:
+    """
+    Monthly gross profit per customer from AOV, purchases/year, and margin (0-1).
+
+    Keeps the ``(aov * freq / 12) * margin`` grouping so the rounded LTV
+    and payback figures stay bit-identical.
+    """
+    return aov * freq / 12 * margin
+
+
+# CAC payback rating: <=6, <=12 months, then longer.
+_PAYBACK_CUT = (6, 12)
+_PAYBACK_RATING = ("Excellent", "Good", "Needs improvement")
+
+# NPS categories: <=30, >30, >50, >70.
+_NPS_CUT = (30, 50, 70)
+_NPS_CATEGORY = (
+    "Needs improvement (<30)",
+    "Good (30-50)",
+    "Excellent (50-70)",
+    "World-class (>70)",
+)
+
+
 class CampaignAnalyticsCalcTool(BaseTool):
     """
     Calculates core campaign performance metrics: CAC, LTV, ROAS, payback period,
@@ -413,6 +724,8 @@ class CampaignAnalyticsCalcTool(BaseTool):
       - nps_score        : Net Promoter Score calculation
     """
 
+    __slots__ = ()
+
     name = "campaign_analytics_calc"
     description = (
         "Calculates campaign and business performance metrics including CAC, LTV, ROAS, "
@@ -448,26 +761,28 @@ class CampaignAnalyticsCalcTool(BaseTool):
         "required": ["calc_type"],
     }
 
+    _DISPATCH: dict[str, str] = {
+        "cac": "_cac",
+        "ltv": "_ltv",
+        "roas": "_roas",
+        "payback_period": "_payback_period",
+        "mrr_growth": "_mrr_growth",
+        "churn_rate": "_churn_rate",
+        "nps_score": "_nps_score",
+    }
+
     def run(self, **kwargs: Any) -> ToolResult:
         calc_type = kwargs.get("calc_type", "")
+        method = self._DISPATCH.get(calc_type) if isinstance(calc_type, str) else None
+        if method is None:
+            return ToolResult(
+                success=False,
+                error=f"Unknown calc_type '{calc_type}'.",
+                tool_name=self.name,
+            )
         try:
-            dispatch = {
-                "cac": self._cac,
-                "ltv": self._ltv,
-                "roas": self._roas,
-                "payback_period": self._payback_period,
-                "mrr_growth": self._mrr_growth,
-                "churn_rate": self._churn_rate,
-                "nps_score": self._nps_score,
-            }
-            if calc_type not in dispatch:
-                return ToolResult(
-                    success=False,
-                    error=f"Unknown calc_type '{calc_type}'.",
-                    tool_name=self.name,
-                )
-            return dispatch[calc_type](**kwargs)
-        except Exception as exc:
+            return getattr(self, method)(**kwargs)
+        except _INPUT_ERRORS as exc:
             return ToolResult(success=False, error=str(exc), tool_name=self.name)
 
     def _cac(self, **kw) -> ToolResult:
@@ -506,10 +821,10 @@ class CampaignAnalyticsCalcTool(BaseTool):
 
         avg_customer_lifespan_months = 1 / churn
         annual_revenue_per_customer = aov * freq
-        monthly_revenue = annual_revenue_per_customer / 12
 
-        ltv = round(monthly_revenue * margin * avg_customer_lifespan_months, 2)
-        ltv_simple = round(aov * freq * avg_customer_lifespan_months / 12, 2)
+        # LTV = monthly gross profit x lifespan
+        ltv = round(_monthly_gross_profit(aov, freq, margin) * avg_customer_lifespan_months, 2)
+        ltv_simple = round(annual_revenue_per_customer * avg_customer_lifespan_months / 12, 2)
 
         return ToolResult(
             success=True,
@@ -534,17 +849,18 @@ class CampaignAnalyticsCalcTool(BaseTool):
         revenue = float(kw.get("revenue_attributed", 0))
         margin = float(kw.get("gross_margin_pct", 70)) / 100
 
-        roas = round(revenue / spend, 2)
-        mroas = round((revenue * margin) / spend, 2)
+        if margin == 0:
+            return ToolResult(
+                success=False,
+                error="gross_margin_pct must be non-zero to calculate breakeven ROAS.",
+                tool_name=self.name,
+            )
 
-        if roas >= 4:
-            rating, note = "Excellent", "Scale this campaign — strong positive ROI."
-        elif roas >= 2:
-            rating, note = "Good", "Performing above break-even. Test scaling budget 20%."
-        elif roas >= 1:
-            rating, note = "Break-even", "Covering spend but not profitable after margin. Optimise creative/targeting."
-        else:
-            rating, note = "Negative ROI", "Pause and audit creative, audience, landing page, and offer."
+        roas = _round2(revenue / spend)
+        mroas = _round2((revenue * margin) / spend)
+
+        # NaN fails every comparison, so it rates as the lowest band.
+        rating, note = _ROAS_RATING[bisect_right(_ROAS_CUT, roas) if roas == roas else 0]
 
         return ToolResult(
             success=True,
@@ -556,7 +872,7 @@ class CampaignAnalyticsCalcTool(BaseTool):
                 "spend": spend,
                 "rating": rating,
                 "action": note,
-                "breakeven_roas": round(1 / margin, 2),
+                "breakeven_roas": _round2(1 / margin),
             },
             tool_name=self.name,
         )
@@ -569,7 +885,7 @@ class CampaignAnalyticsCalcTool(BaseTool):
         margin = float(kw.get("gross_margin_pct", 70)) / 100
 
         cac = spend / new_customers
-        monthly_gross_profit = (aov * freq / 12) * margin
+        monthly_gross_profit = _monthly_gross_profit(aov, freq, margin)
 
         if monthly_gross_profit <= 0:
             return ToolResult(
@@ -587,7 +903,8 @@ class CampaignAnalyticsCalcTool(BaseTool):
                 "payback_period_months": payback_months,
                 "cac": round(cac, 2),
                 "monthly_gross_profit_per_customer": round(monthly_gross_profit, 2),
-                "rating": "Excellent" if payback_months <= 6 else "Good" if payback_months <= 12 else "Needs improvement",
+                # NaN fails every comparison, so it rates as the longest band.
+                "rating": _PAYBACK_RATING[bisect_left(_PAYBACK_CUT, payback_months) if payback_months == payback_months else -1],
                 "benchmark": "SaaS benchmark: <12 months is healthy; <6 months is exceptional.",
             },
             tool_name=self.name,
@@ -597,8 +914,8 @@ class CampaignAnalyticsCalcTool(BaseTool):
         current = float(kw.get("current_mrr", 0))
         previous = max(0.01, float(kw.get("previous_mrr", 0.01)))
 
-        growth_pct = round(((current - previous) / previous) * 100, 2)
-        arr = round(current * 12, 2)
+        growth_pct = _round2(((current - previous) / previous) * 100)
+        arr = _round2(current * 12)
 
         return ToolResult(
             success=True,
@@ -618,9 +935,9 @@ class CampaignAnalyticsCalcTool(BaseTool):
         churned = int(kw.get("churned_customers", 0))
         starting = max(1, int(kw.get("starting_customers", 1)))
 
-        churn_pct = round((churned / starting) * 100, 2)
-        retention_pct = round(100 - churn_pct, 2)
-        avg_lifespan_months = round(100 / max(churn_pct, 0.1), 1)
+        churn_pct = _round2((churned / starting) * 100)
+        retention_pct = _round2(100 - churn_pct)
+        avg_lifespan_months = _round1(100 / max(churn_pct, 0.1))
 
         return ToolResult(
             success=True,
@@ -660,12 +977,7 @@ class CampaignAnalyticsCalcTool(BaseTool):
                 "total_respondents": total,
                 "promoter_pct": round(promoters / total * 100, 1),
                 "detractor_pct": round(detractors / total * 100, 1),
-                "category": (
-                    "World-class (>70)" if nps > 70 else
-                    "Excellent (50-70)" if nps > 50 else
-                    "Good (30-50)" if nps > 30 else
-                    "Needs improvement (<30)"
-                ),
+                "category": _NPS_CATEGORY[bisect_left(_NPS_CUT, nps)],
                 "benchmark": "B2B SaaS average NPS: 30-40. Top-quartile: >50.",
             },
             tool_name=self.name,
@@ -676,7 +988,121 @@ class CampaignAnalyticsCalcTool(BaseTool):
 # 3. Content Optimizer
 # ---------------------------------------------------------------------------
 
-class ContentOptimizerTool(BaseTool):
+# Optimal word counts by content type
+_OPTIMAL_WORD_COUNTS = MappingProxyType({
+    "blog_post": "1500-2500", "landing_page": "500-1500",
+    "email": "150-300", "social_post": "50-150",
+    "video_script": "750-1500", "whitepaper": "3000-6000",
+})
+
+# Flesch Reading Ease grade bands: <30, >=30, >=50, >=70.
+_FRE_THRESHOLDS = (30, 50, 70)
+_FRE_LABELS = (
+    "Very Difficult — Rewrite for clarity.",
+    "Difficult (College level) — Consider simplifying.",
+    "Standard (9th-12th grade) — Good for B2B tech content.",
+    "Easy (6th-8th grade) — Good for broad audience.",
+)
+
+# Keyword density status: <0.5, <=2, <=3, then stuffing. The first cut is
+# the float just below 0.5 so bisect_left keeps 0.5 itself in "Optimal".
+_DENSITY_CUT = (math.nextafter(0.5, 0.0), 2.0, 3.0)
+_DENSITY_STATUS = (
+    ("Under-optimised", "Add keyword naturally 2-3 more times."),
+    ("Optimal (0.5-2%)", "Good keyword density — maintain balance."),
+    ("Slightly over-optimised", "Consider replacing 1-2 instances with synonyms."),
+    ("Keyword stuffing risk", "Reduce occurrences — risk of Google penalty."),
+)
+
+# Meta tag length bands — 0 optimal, 1 acceptable, 2 outside — and their
+# points. Title: 50-60 optimal, 40-70 acceptable; description: 120-155, 100-170.
+_META_TITLE_POINTS = (40, 25, 10)
+_META_DESC_POINTS = (35, 20, 5)
+
+
+def _meta_title_band(length: int) -> int:
+    return 0 if 50 <= length <= 60 else 1 if 40 <= length <= 70 else 2
+
+
+def _meta_desc_band(length: int) -> int:
+    return 0 if 120 <= length <= 155 else 1 if 100 <= length <= 170 else 2
+
+
+_HAS_DIGIT = re.compile(r"\d").search
+_HOW_RE = re.compile(r"how", re.IGNORECASE).search
+
+
+@dataclass(slots=True, frozen=True)
+class ReadabilityResult(ResultData):
+    """Flesch Reading Ease, grade band, and sentence / vocabulary tips."""
+    calc_type: ClassVar[str] = "readability_score"
+    flesch_reading_ease: float
+    grade_level: str
+    word_count: int
+    optimal_word_count_for_type: str
+    recommendations: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class KeywordDensityResult(ResultData):
+    """Primary keyword density with its optimisation status."""
+    calc_type: ClassVar[str] = "keyword_density"
+    keyword_density_pct: float
+    occurrences: int
+    word_count: int
+    status: str
+    recommendation: str
+    optimal_range: str = "0.5-2.0%"
+
+
+@dataclass(slots=True, frozen=True)
+class ContentGapResult(ResultData):
+    """Target-topic coverage and the uncovered topics."""
+    calc_type: ClassVar[str] = "content_gap_analysis"
+    coverage_pct: float
+    total_target_topics: int
+    covered_topics: int
+    gap_topics: tuple[str, ...]
+    score_rating: str
+    action: str
+
+
+# Result for an empty target list — nothing to cover, nothing to compute.
+_EMPTY_CONTENT_GAP = ContentGapResult(
+    coverage_pct=0.0,
+    total_target_topics=0,
+    covered_topics=0,
+    gap_topics=(),
+    score_rating="Significant gaps",
+    action="All target topics are covered.",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class MetaScoreResult(ResultData):
+    """Meta title / description score and the issues found."""
+    calc_type: ClassVar[str] = "meta_score"
+    meta_score: int
+    rating: str
+    issues: tuple[str, ...]
+    title_length: int
+    description_length: int
+    keyword_in_title: bool
+
+
+@dataclass(slots=True, frozen=True)
+class HeadlinePowerResult(ResultData):
+    """Headline power score with improvement tips."""
+    calc_type: ClassVar[str] = "headline_power_score"
+    headline_power_score: int
+    headline: str
+    word_count: int
+    power_words_detected: int
+    rating: str
+    tips: tuple[str, ...]
+
+
+class ContentOptimizerTool(_ColumnBatchTool):
     """
     Analyses and scores content assets for SEO and conversion readability.
 
@@ -688,6 +1114,8 @@ class ContentOptimizerTool(BaseTool):
       - headline_power_score   : Emotional + power word scoring for headlines
     """
 
+    __slots__ = ()
+
     name = "content_optimizer"
     description = (
         "Analyses content assets for readability, keyword density, SEO meta quality, "
@@ -734,89 +1162,108 @@ class ContentOptimizerTool(BaseTool):
         "required": ["calc_type"],
     }
 
+    _DISPATCH: dict[str, str] = {
+        "readability_score": "_readability",
+        "keyword_density": "_keyword_density",
+        "content_gap_analysis": "_content_gap",
+        "meta_score": "_meta_score",
+        "headline_power_score": "_headline_power",
+    }
+
+    # run_many() column-wise calc_types: result packer and its
+    # (field, cast, default) arguments, coerced once per column.
+    _BATCH_COLUMNS = {
+        "keyword_density": (
+            "_keyword_density_result",
+            (("word_count", int, 500), ("keyword_count", int, 0)),
+        ),
+        "meta_score": (
+            "_meta_result",
+            (
+                ("meta_title_length", int, 0),
+                ("meta_description_length", int, 0),
+                ("meta_title_has_keyword", bool, False),
+            ),
+        ),
+    }
+
     def run(self, **kwargs: Any) -> ToolResult:
         calc_type = kwargs.get("calc_type", "")
+        method = self._DISPATCH.get(calc_type) if isinstance(calc_type, str) else None
+        if method is None:
+            return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
         try:
-            dispatch = {
-                "readability_score": self._readability,
-                "keyword_density": self._keyword_density,
-                "content_gap_analysis": self._content_gap,
-                "meta_score": self._meta_score,
-                "headline_power_score": self._headline_power,
-            }
-            if calc_type not in dispatch:
-                return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
-            return dispatch[calc_type](**kwargs)
-        except Exception as exc:
+            return getattr(self, method)(**kwargs)
+        except _INPUT_ERRORS as exc:
             return ToolResult(success=False, error=str(exc), tool_name=self.name)
 
+    def score_meta_batch(
+        self,
+        title_lens: Sequence[int],
+        desc_lens: Sequence[int],
+        has_keyword: Sequence[bool],
+    ) -> list[int]:
+        """
+        Bulk meta_score for scraped pages.
+
+        Takes parallel sequences of title length, description length, and
+        keyword-in-title flags; returns the 0-100 scores only, skipping the
+        issue list and ToolResult construction.
+        """
+        title_points, desc_points = _META_TITLE_POINTS, _META_DESC_POINTS
+        return [
+            title_points[_meta_title_band(int(title))]
+            + desc_points[_meta_desc_band(int(desc))]
+            + (25 if keyword else 0)
+            for title, desc, keyword in zip(title_lens, desc_lens, has_keyword, strict=True)
+        ]
+
     def _readability(self, **kw) -> ToolResult:
         word_count = max(1, int(kw.get("word_count", 500)))
         avg_sentence = float(kw.get("avg_sentence_length", 18))
         avg_syllables = float(kw.get("avg_syllables_per_word", 1.5))
 
         # Flesch Reading Ease approximation
-        fre = round(206.835 - (1.015 * avg_sentence) - (84.6 * avg_syllables), 1)
+        fre = _round1(206.835 - (1.015 * avg_sentence) - (84.6 * avg_syllables))
         fre = max(0.0, min(100.0, fre))
 
-        if fre >= 70:
-            grade_level = "Easy (6th-8th grade) — Good for broad audience."
-        elif fre >= 50:
-            grade_level = "Standard (9th-12th grade) — Good for B2B tech content."
-        elif fre >= 30:
-            grade_level = "Difficult (College level) — Consider simplifying."
-        else:
-            grade_level = "Very Difficult — Rewrite for clarity."
+        grade_level = _FRE_LABELS[bisect_right(_FRE_THRESHOLDS, fre)]
 
-        # Optimal word counts by content type
         content_type = kw.get("content_type", "blog_post")
-        optimal = {
-            "blog_post": "1500-2500", "landing_page": "500-1500",
-            "email": "150-300", "social_post": "50-150",
-            "video_script": "750-1500", "whitepaper": "3000-6000",
-        }.get(content_type, "varies")
+        optimal = _OPTIMAL_WORD_COUNTS.get(content_type, "varies")
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "readability_score",
-                "flesch_reading_ease": fre,
-                "grade_level": grade_level,
-                "word_count": word_count,
-                "optimal_word_count_for_type": optimal,
-                "recommendations": [
-                    f"Shorten sentences to <20 words average." if avg_sentence > 22 else "Sentence length is good.",
-                    f"Simplify vocabulary — aim for <1.4 avg syllables/word." if avg_syllables > 1.6 else "Vocabulary complexity is appropriate.",
-                ],
-            },
+            data=ReadabilityResult(
+                flesch_reading_ease=fre,
+                grade_level=grade_level,
+                word_count=word_count,
+                optimal_word_count_for_type=optimal,
+                recommendations=(
+                    "Shorten sentences to <20 words average." if avg_sentence > 22 else "Sentence length is good.",
+                    "Simplify vocabulary — aim for <1.4 avg syllables/word." if avg_syllables > 1.6 else "Vocabulary complexity is appropriate.",
+                ),
+            ),
             tool_name=self.name,
         )
 
     def _keyword_density(self, **kw) -> ToolResult:
-        words = max(1, int(kw.get("word_count", 500)))
-        occurrences = int(kw.get("keyword_count", 0))
-        density = round((occurrences / words) * 100, 2)
-
-        if density < 0.5:
-            status, tip = "Under-optimised", "Add keyword naturally 2-3 more times."
-        elif density <= 2.0:
-            status, tip = "Optimal (0.5-2%)", "Good keyword density — maintain balance."
-        elif density <= 3.0:
-            status, tip = "Slightly over-optimised", "Consider replacing 1-2 instances with synonyms."
-        else:
-            status, tip = "Keyword stuffing risk", "Reduce occurrences — risk of Google penalty."
+        return self._keyword_density_result(int(kw.get("word_count", 500)), int(kw.get("keyword_count", 0)))
+
+    def _keyword_density_result(self, words: int, occurrences: int) -> ToolResult:
+        words = max(1, words)
+        density = _round2((occurrences / words) * 100)
+        status, tip = _DENSITY_STATUS[bisect_left(_DENSITY_CUT, density)]
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "keyword_density",
-                "keyword_density_pct": density,
-                "occurrences": occurrences,
-                "word_count": words,
-                "status": status,
-                "recommendation": tip,
-                "optimal_range": "0.5-2.0%",
-            },
+            data=KeywordDensityResult(
+                keyword_density_pct=density,
+                occurrences=occurrences,
+                word_count=words,
+                status=status,
+                recommendation=tip,
+            ),
             tool_name=self.name,
         )
 
@@ -824,77 +1271,73 @@ class ContentOptimizerTool(BaseTool):
         target = kw.get("target_keywords", [])
         covered = kw.get("covered_keywords", [])
 
-        target_set = set(str(k).lower() for k in target)
-        covered_set = set(str(k).lower() for k in covered)
-        gaps = sorted(target_set - covered_set)
-        coverage_pct = round(len(covered_set & target_set) / max(1, len(target_set)) * 100, 1)
+        # Build both sets first so non-iterable inputs still fail in run().
+        target_set = {str(k).lower() for k in target}
+        covered_set = {str(k).lower() for k in covered}
+        if not target_set:
+            return ToolResult(success=True, data=_EMPTY_CONTENT_GAP, tool_name=self.name)
+        gaps_set = target_set - covered_set
+        covered_count = len(target_set) - len(gaps_set)
+        gaps = tuple(sorted(gaps_set))
+        coverage_pct = _round1(covered_count / max(1, len(target_set)) * 100)
+        if gaps:
+            action = "Add sections covering: " + ", ".join(gaps[:5]) + ("..." if len(gaps) > 5 else "") + "."
+        else:
+            action = "All target topics are covered."
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "content_gap_analysis",
-                "coverage_pct": coverage_pct,
-                "total_target_topics": len(target_set),
-                "covered_topics": len(covered_set & target_set),
-                "gap_topics": gaps,
-                "score_rating": "Comprehensive" if coverage_pct >= 80 else "Adequate" if coverage_pct >= 60 else "Significant gaps",
-                "action": f"Add sections covering: {', '.join(gaps[:5])}{'...' if len(gaps) > 5 else ''}." if gaps else "All target topics are covered.",
-            },
+            data=ContentGapResult(
+                coverage_pct=coverage_pct,
+                total_target_topics=len(target_set),
+                covered_topics=covered_count,
+                gap_topics=gaps,
+                score_rating="Comprehensive" if coverage_pct >= 80 else "Adequate" if coverage_pct >= 60 else "Significant gaps",
+                action=action,
+            ),
             tool_name=self.name,
         )
 
     def _meta_score(self, **kw) -> ToolResult:
-        title_len = int(kw.get("meta_title_length", 0))
-        desc_len = int(kw.get("meta_description_length", 0))
-        has_keyword = bool(kw.get("meta_title_has_keyword", False))
+        return self._meta_result(
+            int(kw.get("meta_title_length", 0)),
+            int(kw.get("meta_description_length", 0)),
+            bool(kw.get("meta_title_has_keyword", False)),
+        )
 
-        score = 0
-        issues = []
+    def _meta_result(self, title_len: int, desc_len: int, has_keyword: bool) -> ToolResult:
+        title_band = _meta_title_band(title_len)
+        desc_band = _meta_desc_band(desc_len)
+        score = _META_TITLE_POINTS[title_band] + _META_DESC_POINTS[desc_band] + (25 if has_keyword else 0)
 
-        # Title: 50-60 chars is optimal
-        if 50 <= title_len <= 60:
-            score += 40
-        elif 40 <= title_len <= 70:
-            score += 25
+        issues = []
+        if title_band == 1:
             issues.append(f"Title length {title_len} chars — optimal is 50-60.")
-        else:
-            score += 10
+        elif title_band == 2:
             issues.append(f"Title length {title_len} chars is outside optimal range (50-60).")
-
-        # Description: 120-155 chars
-        if 120 <= desc_len <= 155:
-            score += 35
-        elif 100 <= desc_len <= 170:
-            score += 20
+        if desc_band == 1:
             issues.append(f"Description {desc_len} chars — optimal is 120-155.")
-        else:
-            score += 5
+        elif desc_band == 2:
             issues.append(f"Description {desc_len} chars is outside optimal range.")
-
-        # Keyword in title
-        if has_keyword:
-            score += 25
-        else:
+        if not has_keyword:
             issues.append("Primary keyword missing from meta title — add it near the front.")
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "meta_score",
-                "meta_score": score,
-                "rating": "Excellent" if score >= 85 else "Good" if score >= 65 else "Needs improvement",
-                "issues": issues if issues else ["All meta fields are well-optimised."],
-                "title_length": title_len,
-                "description_length": desc_len,
-                "keyword_in_title": has_keyword,
-            },
+            data=MetaScoreResult(
+                meta_score=score,
+                rating="Excellent" if score >= 85 else "Good" if score >= 65 else "Needs improvement",
+                issues=tuple(issues) if issues else ("All meta fields are well-optimised.",),
+                title_length=title_len,
+                description_length=desc_len,
+                keyword_in_title=has_keyword,
+            ),
             tool_name=self.name,
         )
 
     def _headline_power(self, **kw) -> ToolResult:
         headline = str(kw.get("headline_text", ""))
-        words = headline.split()
-        word_count = len(words)
+        word_count = len(headline.split())
         power_words = int(kw.get("power_word_count", 0))
 
         # Scoring components
@@ -902,29 +1345,28 @@ class ContentOptimizerTool(BaseTool):
         power_score = min(35, power_words * 10)
 
         # Check for number (specificity)
-        has_number = any(c.isdigit() for c in headline)
+        has_number = _HAS_DIGIT(headline) is not None
         number_score = 20 if has_number else 5
 
         # Check for question or "how-to"
-        trigger_score = 15 if headline.strip().endswith("?") or "how" in headline.lower() else 0
+        trigger_score = 15 if headline.rstrip().endswith("?") or _HOW_RE(headline) else 0
 
         total = min(100, length_score + power_score + number_score + trigger_score)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "headline_power_score",
-                "headline_power_score": total,
-                "headline": headline,
-                "word_count": word_count,
-                "power_words_detected": power_words,
-                "rating": "High impact" if total >= 70 else "Average" if total >= 45 else "Weak",
-                "tips": [
+            data=HeadlinePowerResult(
+                headline_power_score=total,
+                headline=headline,
+                word_count=word_count,
+                power_words_detected=power_words,
+                rating="High impact" if total >= 70 else "Average" if total >= 45 else "Weak",
+                tips=(
                     "Add a specific number (e.g. '7 Ways...' or '$50K in 90 days')." if not has_number else "Good — headline contains a specific number.",
                     "Include power/emotional words: 'proven', 'secret', 'ultimate', 'guaranteed'." if power_words < 2 else "Good power word usage.",
                     "Aim for 6-12 word headlines for maximum click-through." if word_count < 6 or word_count > 12 else "Headline length is optimal.",
-                ],
-            },
+                ),
+            ),
             tool_name=self.name,
         )
 
@@ -933,6 +1375,91 @@ class ContentOptimizerTool(BaseTool):
 # 4. SEO Analyzer
 # ---------------------------------------------------------------------------
 
+# Organic CTR (%) by SERP position 1-10.
+_CTR_BY_POSITION = tuple(enumerate((28.5, 15.7, 11.0, 8.0, 7.2, 5.1, 4.0, 3.2, 2.8, 2.5), start=1))
+
+
+def _da_kernel(age_years: float, referring_domains: int, total_backlinks: int) -> tuple[float, float, float, float]:
+    """Log-based DA model: (age_factor, rd_factor, bl_factor, estimated_da)."""
+    age_factor = min(20, _log1p(age_years) * 7)
+    rd_factor = min(50, _log1p(referring_domains) * 8)
+    bl_factor = min(30, _log1p(total_backlinks) * 4)
+    return age_factor, rd_factor, bl_factor, min(99.0, _round1(age_factor + rd_factor + bl_factor))
+
+
+def _kd_kernel(competition: float, search_volume: int) -> float:
+    """Keyword difficulty 0-100 from clamped competition and search volume."""
+    volume_factor = min(30, _log1p(search_volume) * 2.5)
+    return min(100.0, _round1(competition * 70 + volume_factor))
+
+
+def _rank_kernel(current_da: float, top_da: float, content_quality: float) -> float:
+    """Page-1 rank probability (%) clamped to 2-95."""
+    da_ratio = min(1.0, current_da / max(1, top_da))
+    prob = _round1((da_ratio * 0.55 + content_quality / 100 * 0.45) * 100)
+    return min(95.0, max(2.0, prob))
+
+
+@dataclass(slots=True, frozen=True)
+class DomainAuthorityResult(ResultData):
+    """Estimated DA with its age / referring-domain / backlink contributions."""
+    calc_type: ClassVar[str] = "domain_authority_estimate"
+    estimated_da: float
+    tier: str
+    age_contribution: float
+    referring_domains_contribution: float
+    backlinks_contribution: float
+    growth_tip: str = "Focus on earning 5-10 new high-quality referring domains per month to accelerate DA growth."
+
+
+@dataclass(slots=True, frozen=True)
+class KeywordDifficultyResult(ResultData):
+    """Keyword difficulty score, label, and ranking strategy."""
+    calc_type: ClassVar[str] = "keyword_difficulty"
+    keyword: str
+    keyword_difficulty_score: float
+    difficulty_label: str
+    strategy: str
+    search_volume: int
+    competition_score: float
+
+
+@dataclass(slots=True, frozen=True)
+class TrafficPotentialResult(ResultData):
+    """Monthly organic traffic at the input CTR and per SERP position."""
+    calc_type: ClassVar[str] = "traffic_potential"
+    search_volume: int
+    estimated_traffic_at_input_ctr: int
+    ctr_used_pct: float
+    traffic_by_ranking_position: dict[int, int]
+    recommendation: str
+
+
+@dataclass(slots=True, frozen=True)
+class BacklinkVelocityResult(ResultData):
+    """Month-over-month backlink growth and trend."""
+    calc_type: ClassVar[str] = "backlink_velocity"
+    velocity_pct_mom: float
+    this_month: int
+    last_month: int
+    trend: str
+    note: str = (
+        "Natural, steady backlink growth signals quality to search engines. "
+        "Sudden spikes (>200% MoM) can trigger spam filters."
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class RankProbabilityResult(ResultData):
+    """Page-1 rank probability against the competitor DA average."""
+    calc_type: ClassVar[str] = "rank_probability"
+    page1_rank_probability_pct: float
+    current_da: float
+    competitor_avg_da: float
+    content_quality_score: float
+    recommendation: str
+
+
 class SEOAnalyzerTool(BaseTool):
     """
     Estimates SEO metrics for keyword and domain strategy.
@@ -945,6 +1472,8 @@ class SEOAnalyzerTool(BaseTool):
       - rank_probability           : Probability of ranking on page 1
     """
 
+    __slots__ = ()
+
     name = "seo_analyzer"
     description = (
         "Analyses SEO opportunity metrics: domain authority estimate, keyword difficulty, "
@@ -980,20 +1509,22 @@ class SEOAnalyzerTool(BaseTool):
         "required": ["calc_type"],
     }
 
+    _DISPATCH: dict[str, str] = {
+        "domain_authority_estimate": "_da_estimate",
+        "keyword_difficulty": "_keyword_difficulty",
+        "traffic_potential": "_traffic_potential",
+        "backlink_velocity": "_backlink_velocity",
+        "rank_probability": "_rank_probability",
+    }
+
     def run(self, **kwargs: Any) -> ToolResult:
         calc_type = kwargs.get("calc_type", "")
+        method = self._DISPATCH.get(calc_type) if isinstance(calc_type, str) else None
+        if method is None:
+            return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
         try:
-            dispatch = {
-                "domain_authority_estimate": self._da_estimate,
-                "keyword_difficulty": self._keyword_difficulty,
-                "traffic_potential": self._traffic_potential,
-                "backlink_velocity": self._backlink_velocity,
-                "rank_probability": self._rank_probability,
-            }
-            if calc_type not in dispatch:
-                return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
-            return dispatch[calc_type](**kwargs)
-        except Exception as exc:
+            return getattr(self, method)(**kwargs)
+        except _INPUT_ERRORS as exc:
             return ToolResult(success=False, error=str(exc), tool_name=self.name)
 
     def _da_estimate(self, **kw) -> ToolResult:
@@ -1001,25 +1532,18 @@ class SEOAnalyzerTool(BaseTool):
         referring_domains = int(kw.get("referring_domains", 0))
         total_backlinks = int(kw.get("total_backlinks", 0))
 
-        # Simplified DA model: log-based scoring
-        age_factor = min(20, math.log1p(age_years) * 7)
-        rd_factor = min(50, math.log1p(referring_domains) * 8)
-        bl_factor = min(30, math.log1p(total_backlinks) * 4)
-
-        da = round(age_factor + rd_factor + bl_factor, 1)
-        da = min(99.0, da)
+        age_factor, rd_factor, bl_factor, da = _da_kernel(age_years, referring_domains, total_backlinks)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "domain_authority_estimate",
-                "estimated_da": da,
-                "tier": "High authority (DA 60+)" if da >= 60 else "Medium authority (DA 30-60)" if da >= 30 else "Low authority (DA <30)",
-                "age_contribution": round(age_factor, 1),
-                "referring_domains_contribution": round(rd_factor, 1),
-                "backlinks_contribution": round(bl_factor, 1),
-                "growth_tip": "Focus on earning 5-10 new high-quality referring domains per month to accelerate DA growth.",
-            },
+            data=DomainAuthorityResult(
+                estimated_da=da,
+                tier="High authority (DA 60+)" if da >= 60 else "Medium authority (DA 30-60)" if da >= 30 else "Low authority (DA <30)",
+                # A capped factor is the int cap, reported as-is like round(cap, 1).
+                age_contribution=age_factor if age_factor == 20 else _round1(age_factor),
+                referring_domains_contribution=rd_factor if rd_factor == 50 else _round1(rd_factor),
+                backlinks_contribution=bl_factor if bl_factor == 30 else _round1(bl_factor),
+            ),
             tool_name=self.name,
         )
 
@@ -1028,9 +1552,7 @@ class SEOAnalyzerTool(BaseTool):
         search_volume = int(kw.get("search_volume", 0))
 
         # Difficulty increases with competition; high volume keywords are more competitive
-        volume_factor = min(30, math.log1p(search_volume) * 2.5)
-        kd = round(competition * 70 + volume_factor, 1)
-        kd = min(100.0, kd)
+        kd = _kd_kernel(competition, search_volume)
 
         if kd >= 70:
             label, strategy = "Hard", "Target long-tail variants first. Build authority over 12+ months."
@@ -1041,15 +1563,14 @@ class SEOAnalyzerTool(BaseTool):
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "keyword_difficulty",
-                "keyword": kw.get("keyword", ""),
-                "keyword_difficulty_score": kd,
-                "difficulty_label": label,
-                "strategy": strategy,
-                "search_volume": search_volume,
-                "competition_score": competition,
-            },
+            data=KeywordDifficultyResult(
+                keyword=kw.get("keyword", ""),
+                keyword_difficulty_score=kd,
+                difficulty_label=label,
+                strategy=strategy,
+                search_volume=search_volume,
+                competition_score=competition,
+            ),
             tool_name=self.name,
         )
 
@@ -1057,25 +1578,21 @@ class SEOAnalyzerTool(BaseTool):
         search_volume = int(kw.get("search_volume", 0))
         ctr_pct = float(kw.get("ctr_estimate_pct", 5.0))
 
-        # CTR by position benchmarks
-        ctr_by_position = {1: 28.5, 2: 15.7, 3: 11.0, 4: 8.0, 5: 7.2, 6: 5.1, 7: 4.0, 8: 3.2, 9: 2.8, 10: 2.5}
-
         traffic_by_position = {
-            pos: round(search_volume * ctr / 100) for pos, ctr in ctr_by_position.items()
+            pos: round(search_volume * ctr / 100) for pos, ctr in _CTR_BY_POSITION
         }
         estimated_traffic = round(search_volume * ctr_pct / 100)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "traffic_potential",
-                "search_volume": search_volume,
-                "estimated_traffic_at_input_ctr": estimated_traffic,
-                "ctr_used_pct": ctr_pct,
-                "traffic_by_ranking_position": traffic_by_position,
-                "recommendation": f"Ranking #1 would yield ~{traffic_by_position[1]:,} monthly visitors. "
-                                  f"Even position #5 delivers ~{traffic_by_position[5]:,} visits.",
-            },
+            data=TrafficPotentialResult(
+                search_volume=search_volume,
+                estimated_traffic_at_input_ctr=estimated_traffic,
+                ctr_used_pct=ctr_pct,
+                traffic_by_ranking_position=traffic_by_position,
+                recommendation=f"Ranking #1 would yield ~{traffic_by_position[1]:,} monthly visitors. "
+                               f"Even position #5 delivers ~{traffic_by_position[5]:,} visits.",
+            ),
             tool_name=self.name,
         )
 
@@ -1083,21 +1600,16 @@ class SEOAnalyzerTool(BaseTool):
         this_month = int(kw.get("new_backlinks_this_month", 0))
         last_month = max(1, int(kw.get("new_backlinks_last_month", 1)))
 
-        velocity_pct = round(((this_month - last_month) / last_month) * 100, 1)
+        velocity_pct = _round1(((this_month - last_month) / last_month) * 100)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "backlink_velocity",
-                "velocity_pct_mom": velocity_pct,
-                "this_month": this_month,
-                "last_month": last_month,
-                "trend": "Accelerating" if velocity_pct > 10 else "Growing" if velocity_pct > 0 else "Declining",
-                "note": (
-                    "Natural, steady backlink growth signals quality to search engines. "
-                    "Sudden spikes (>200% MoM) can trigger spam filters."
-                ),
-            },
+            data=BacklinkVelocityResult(
+                velocity_pct_mom=velocity_pct,
+                this_month=this_month,
+                last_month=last_month,
+                trend="Accelerating" if velocity_pct > 10 else "Growing" if velocity_pct > 0 else "Declining",
+            ),
             tool_name=self.name,
         )
 
@@ -1106,28 +1618,23 @@ class SEOAnalyzerTool(BaseTool):
         top_da = float(kw.get("top_ranking_da_avg", 60))
         content_quality = min(100, max(0, float(kw.get("content_quality_score", 50))))
 
-        da_ratio = min(1.0, current_da / max(1, top_da))
-        content_factor = content_quality / 100
-
-        prob = round((da_ratio * 0.55 + content_factor * 0.45) * 100, 1)
-        prob = min(95.0, max(2.0, prob))
+        prob = _rank_kernel(current_da, top_da, content_quality)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "rank_probability",
-                "page1_rank_probability_pct": prob,
-                "current_da": current_da,
-                "competitor_avg_da": top_da,
-                "content_quality_score": content_quality,
-                "recommendation": (
+            data=RankProbabilityResult(
+                page1_rank_probability_pct=prob,
+                current_da=current_da,
+                competitor_avg_da=top_da,
+                content_quality_score=content_quality,
+                recommendation=(
                     "Strong chance to rank. Publish and promote actively."
                     if prob >= 60 else
                     "Moderate chance. Invest in link building and content depth before targeting."
                     if prob >= 35 else
                     "Low probability currently. Build DA and improve content before targeting this keyword."
                 ),
-            },
+            ),
             tool_name=self.name,
         )
 
@@ -1136,6 +1643,97 @@ class SEOAnalyzerTool(BaseTool):
 # 5. Email Campaign Manager
 # ---------------------------------------------------------------------------
 
+# Industry open / click rate benchmarks (%)
+_OPEN_BENCHMARKS = MappingProxyType({
+    "SaaS": 21.5, "E-commerce": 15.7, "B2B Services": 20.1,
+    "Media": 22.3, "Healthcare": 23.4, "Finance": 20.5, "Other": 19.0,
+})
+_CLICK_BENCHMARKS = MappingProxyType({
+    "SaaS": 3.1, "E-commerce": 2.3, "B2B Services": 3.4,
+    "Media": 4.2, "Healthcare": 3.8, "Finance": 2.9, "Other": 2.6,
+})
+
+# Deliverability points: bounce <=0.5, <=2, <=5, then worse (35 pts max);
+# spam complaints <=0.08, <=0.2, then worse (35 pts max).
+_BOUNCE_CUT = (0.5, 2.0, 5.0)
+_BOUNCE_SCORE = (35, 25, 12, 0)
+_SPAM_CUT = (0.08, 0.2)
+_SPAM_SCORE = (35, 20, 5)
+
+
+@dataclass(slots=True, frozen=True)
+class DeliverabilityResult(ResultData):
+    """Deliverability score from authentication, bounce and spam rates."""
+    calc_type: ClassVar[str] = "deliverability_score"
+    deliverability_score: float
+    rating: str
+    authentication: dict[str, bool]
+    bounce_rate_pct: float
+    spam_complaint_rate_pct: float
+    issues: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class OpenRateBenchmarkResult(ResultData):
+    """Open rate against its industry benchmark."""
+    calc_type: ClassVar[str] = "open_rate_benchmark"
+    actual_open_rate_pct: float
+    industry_benchmark_pct: float
+    industry: str
+    delta_vs_benchmark: float
+    performance: str
+    tips: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class ClickRateBenchmarkResult(ResultData):
+    """Click rate against its industry benchmark."""
+    calc_type: ClassVar[str] = "click_rate_benchmark"
+    actual_click_rate_pct: float
+    industry_benchmark_pct: float
+    industry: str
+    delta_vs_benchmark: float
+    performance: str
+    tips: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class RevenuePerEmailResult(ResultData):
+    """Revenue per email sent and the revenue / conversions behind it."""
+    calc_type: ClassVar[str] = "revenue_per_email"
+    revenue_per_email: float
+    total_revenue: float
+    estimated_conversions: int
+    emails_sent: int
+    conversion_rate_pct: Any
+    aov: float
+    benchmark: str = "Strong email programmes generate $0.05-$0.20 RPE. World-class: >$1.00 RPE."
+
+
+@dataclass(slots=True, frozen=True)
+class ListHealthResult(ResultData):
+    """List health score with cleaning recommendations."""
+    calc_type: ClassVar[str] = "list_health_score"
+    list_health_score: float
+    list_size: int
+    health_rating: str
+    recommendations: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class SequenceROIResult(ResultData):
+    """Email sequence ROI, cost, revenue, and rating."""
+    calc_type: ClassVar[str] = "sequence_roi"
+    sequence_roi_pct: float
+    total_revenue: float
+    total_cost: float
+    net_profit: float
+    revenue_per_email: float
+    total_sends: int
+    conversions: int
+    rating: str
+
+
 class EmailCampaignManagerTool(BaseTool):
     """
     Analyses and scores email campaign performance and strategy.
@@ -1149,6 +1747,8 @@ class EmailCampaignManagerTool(BaseTool):
       - sequence_roi            : Full email sequence ROI calculation
     """
 
+    __slots__ = ()
+
     name = "email_campaign_manager"
     description = (
         "Analyses email campaign health and performance: deliverability scoring, open/click "
@@ -1193,33 +1793,52 @@ class EmailCampaignManagerTool(BaseTool):
         "required": ["calc_type"],
     }
 
-    # Industry open rate benchmarks
-    _OPEN_BENCHMARKS = {
-        "SaaS": 21.5, "E-commerce": 15.7, "B2B Services": 20.1,
-        "Media": 22.3, "Healthcare": 23.4, "Finance": 20.5, "Other": 19.0,
-    }
-    _CLICK_BENCHMARKS = {
-        "SaaS": 3.1, "E-commerce": 2.3, "B2B Services": 3.4,
-        "Media": 4.2, "Healthcare": 3.8, "Finance": 2.9, "Other": 2.6,
+    _DISPATCH: dict[str, str] = {
+        "deliverability_score": "_deliverability",
+        "open_rate_benchmark": "_open_rate_benchmark",
+        "click_rate_benchmark": "_click_rate_benchmark",
+        "revenue_per_email": "_revenue_per_email",
+        "list_health_score": "_list_health",
+        "sequence_roi": "_sequence_roi",
     }
 
     def run(self, **kwargs: Any) -> ToolResult:
         calc_type = kwargs.get("calc_type", "")
+        method = self._DISPATCH.get(calc_type) if isinstance(calc_type, str) else None
+        if method is None:
+            return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
         try:
-            dispatch = {
-                "deliverability_score": self._deliverability,
-                "open_rate_benchmark": self._open_rate_benchmark,
-                "click_rate_benchmark": self._click_rate_benchmark,
-                "revenue_per_email": self._revenue_per_email,
-                "list_health_score": self._list_health,
-                "sequence_roi": self._sequence_roi,
-            }
-            if calc_type not in dispatch:
-                return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
-            return dispatch[calc_type](**kwargs)
-        except Exception as exc:
+            return getattr(self, method)(**kwargs)
+        except _INPUT_ERRORS as exc:
             return ToolResult(success=False, error=str(exc), tool_name=self.name)
 
+    def score_deliverability_batch(
+        self,
+        bounce_rates: Sequence[float],
+        spam_rates: Sequence[float],
+        auth_counts: Sequence[int],
+    ) -> list[float]:
+        """
+        Bulk deliverability_score for list audits.
+
+        Takes parallel sequences of bounce rate %, spam complaint rate %, and
+        the number of SPF / DKIM / DMARC records in place (clipped to 0-3);
+        returns the 0-100 scores only, skipping the issue list and ToolResult
+        construction.
+        """
+        bounce_cut, bounce_points = _BOUNCE_CUT, _BOUNCE_SCORE
+        spam_cut, spam_points = _SPAM_CUT, _SPAM_SCORE
+        scores = []
+        for bounce, spam, auth in zip(bounce_rates, spam_rates, auth_counts, strict=True):
+            bounce, spam, auth = float(bounce), float(spam), int(auth)
+            auth = 0 if auth < 0 else 3 if auth > 3 else auth
+            scores.append(float(
+                10 * auth
+                + bounce_points[bisect_left(bounce_cut, bounce) if bounce == bounce else -1]
+                + spam_points[bisect_left(spam_cut, spam) if spam == spam else -1]
+            ))
+        return scores
+
     def _deliverability(self, **kw) -> ToolResult:
         bounce = float(kw.get("bounce_rate_pct", 0))
         spam = float(kw.get("spam_complaint_rate_pct", 0))
@@ -1227,102 +1846,86 @@ class EmailCampaignManagerTool(BaseTool):
         has_dkim = bool(kw.get("has_dkim", False))
         has_dmarc = bool(kw.get("has_dmarc", False))
 
-        score = 100.0
-        issues = []
+        # Authentication (30 pts), bounce rate (35 pts), spam complaints (35 pts)
+        auth_score = 10 * has_spf + 10 * has_dkim + 10 * has_dmarc
+        # NaN fails every <= test, so it takes the worst tier as the ladder did.
+        bounce_tier = bisect_left(_BOUNCE_CUT, bounce) if bounce == bounce else len(_BOUNCE_CUT)
+        spam_tier = bisect_left(_SPAM_CUT, spam) if spam == spam else len(_SPAM_CUT)
+        score = max(0, min(100, float(auth_score + _BOUNCE_SCORE[bounce_tier] + _SPAM_SCORE[spam_tier])))
 
-        # Authentication (30 pts total)
-        auth_score = (10 if has_spf else 0) + (10 if has_dkim else 0) + (10 if has_dmarc else 0)
-        score = score - 30 + auth_score
+        issues = []
         if not has_spf: issues.append("Set up SPF record to authenticate sending domain.")
         if not has_dkim: issues.append("Enable DKIM signing in your ESP.")
         if not has_dmarc: issues.append("Publish a DMARC policy (start with p=none for monitoring).")
 
-        # Bounce rate (35 pts)
-        if bounce <= 0.5:
-            bounce_score = 35
-        elif bounce <= 2.0:
-            bounce_score = 25
+        if bounce_tier == 1:
             issues.append(f"Bounce rate {bounce}% is elevated. Clean list with email verification.")
-        elif bounce <= 5.0:
-            bounce_score = 12
+        elif bounce_tier == 2:
             issues.append(f"High bounce rate {bounce}% — urgent list cleaning required.")
-        else:
-            bounce_score = 0
+        elif bounce_tier == 3:
             issues.append(f"Critical bounce rate {bounce}% — ESPs will block sending. Pause and clean.")
-        score = score - 35 + bounce_score
 
-        # Spam complaint rate (35 pts)
-        if spam <= 0.08:
-            spam_score = 35
-        elif spam <= 0.2:
-            spam_score = 20
+        if spam_tier == 1:
             issues.append(f"Spam complaints {spam}% approaching danger zone. Review content and list quality.")
-        else:
-            spam_score = 5
+        elif spam_tier == 2:
             issues.append(f"Spam complaint rate {spam}% is critical — ISPs will blacklist your domain.")
-        score = score - 35 + spam_score
-
-        score = max(0, min(100, round(score, 1)))
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "deliverability_score",
-                "deliverability_score": score,
-                "rating": "Excellent" if score >= 85 else "Good" if score >= 65 else "At risk" if score >= 40 else "Critical",
-                "authentication": {"SPF": has_spf, "DKIM": has_dkim, "DMARC": has_dmarc},
-                "bounce_rate_pct": bounce,
-                "spam_complaint_rate_pct": spam,
-                "issues": issues if issues else ["Deliverability health is excellent."],
-            },
+            data=DeliverabilityResult(
+                deliverability_score=score,
+                rating="Excellent" if score >= 85 else "Good" if score >= 65 else "At risk" if score >= 40 else "Critical",
+                authentication={"SPF": has_spf, "DKIM": has_dkim, "DMARC": has_dmarc},
+                bounce_rate_pct=bounce,
+                spam_complaint_rate_pct=spam,
+                issues=tuple(issues) if issues else ("Deliverability health is excellent.",),
+            ),
             tool_name=self.name,
         )
 
     def _open_rate_benchmark(self, **kw) -> ToolResult:
         actual = float(kw.get("open_rate_pct", 0))
         industry = kw.get("industry", "Other")
-        benchmark = self._OPEN_BENCHMARKS.get(industry, 19.0)
-        delta = round(actual - benchmark, 1)
+        benchmark = _OPEN_BENCHMARKS.get(industry, 19.0)
+        delta = _round1(actual - benchmark)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "open_rate_benchmark",
-                "actual_open_rate_pct": actual,
-                "industry_benchmark_pct": benchmark,
-                "industry": industry,
-                "delta_vs_benchmark": delta,
-                "performance": "Above benchmark" if delta >= 0 else "Below benchmark",
-                "tips": [
+            data=OpenRateBenchmarkResult(
+                actual_open_rate_pct=actual,
+                industry_benchmark_pct=benchmark,
+                industry=industry,
+                delta_vs_benchmark=delta,
+                performance="Above benchmark" if delta >= 0 else "Below benchmark",
+                tips=(
                     "A/B test subject lines with curiosity, urgency, or personalisation." if actual < benchmark else "Maintain subject line strategy.",
                     "Segment list by engagement level — send re-engagement campaign to cold subscribers.",
                     "Test send times: Tue-Thu, 10 AM or 2 PM recipient local time typically outperform.",
-                ],
-            },
+                ),
+            ),
             tool_name=self.name,
         )
 
     def _click_rate_benchmark(self, **kw) -> ToolResult:
         actual = float(kw.get("click_rate_pct", 0))
         industry = kw.get("industry", "Other")
-        benchmark = self._CLICK_BENCHMARKS.get(industry, 2.6)
-        delta = round(actual - benchmark, 1)
+        benchmark = _CLICK_BENCHMARKS.get(industry, 2.6)
+        delta = _round1(actual - benchmark)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "click_rate_benchmark",
-                "actual_click_rate_pct": actual,
-                "industry_benchmark_pct": benchmark,
-                "industry": industry,
-                "delta_vs_benchmark": delta,
-                "performance": "Above benchmark" if delta >= 0 else "Below benchmark",
-                "tips": [
+            data=ClickRateBenchmarkResult(
+                actual_click_rate_pct=actual,
+                industry_benchmark_pct=benchmark,
+                industry=industry,
+                delta_vs_benchmark=delta,
+                performance="Above benchmark" if delta >= 0 else "Below benchmark",
+                tips=(
                     "Use a single, prominent CTA button rather than multiple text links.",
                     "Add urgency: 'Offer expires in 48 hours' or 'Only 3 spots remaining'.",
                     "Personalise email content using segmentation data.",
-                ] if actual < benchmark else ["CTR is performing well. Test adding a secondary CTA."],
-            },
+                ) if actual < benchmark else ("CTR is performing well. Test adding a secondary CTA.",),
+            ),
             tool_name=self.name,
         )
 
@@ -1332,21 +1935,19 @@ class EmailCampaignManagerTool(BaseTool):
         aov = float(kw.get("average_order_value", 0))
 
         conversions = round(emails_sent * conversion_rate)
-        total_revenue = round(conversions * aov, 2)
-        rpe = round(total_revenue / emails_sent, 4)
+        total_revenue = _round2(conversions * aov)
+        rpe = _round4(total_revenue / emails_sent)
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "revenue_per_email",
-                "revenue_per_email": rpe,
-                "total_revenue": total_revenue,
-                "estimated_conversions": conversions,
-                "emails_sent": emails_sent,
-                "conversion_rate_pct": kw.get("conversion_rate_pct"),
-                "aov": aov,
-                "benchmark": "Strong email programmes generate $0.05-$0.20 RPE. World-class: >$1.00 RPE.",
-            },
+            data=RevenuePerEmailResult(
+                revenue_per_email=rpe,
+                total_revenue=total_revenue,
+                estimated_conversions=conversions,
+                emails_sent=emails_sent,
+                conversion_rate_pct=kw.get("conversion_rate_pct"),
+                aov=aov,
+            ),
             tool_name=self.name,
         )
 
@@ -1375,17 +1976,16 @@ class EmailCampaignManagerTool(BaseTool):
 
         if age_months > 24: score -= 10; recommendations.append("Old list — run re-engagement campaign and remove non-responders.")
 
-        score = max(0, round(score, 1))
+        score = max(0, _round1(score))
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "list_health_score",
-                "list_health_score": score,
-                "list_size": list_size,
-                "health_rating": "Healthy" if score >= 75 else "Fair" if score >= 50 else "At risk",
-                "recommendations": recommendations if recommendations else ["List health is excellent. Maintain regular cleaning cadence."],
-            },
+            data=ListHealthResult(
+                list_health_score=score,
+                list_size=list_size,
+                health_rating="Healthy" if score >= 75 else "Fair" if score >= 50 else "At risk",
+                recommendations=tuple(recommendations) if recommendations else ("List health is excellent. Maintain regular cleaning cadence.",),
+            ),
             tool_name=self.name,
         )
 
@@ -1397,24 +1997,23 @@ class EmailCampaignManagerTool(BaseTool):
         aov = float(kw.get("average_order_value", 0))
 
         total_sends = list_size * sequence_emails
-        total_cost = round(total_sends * cost_per_send, 2)
-        total_revenue = round(conversions * aov, 2)
-        roi = round(((total_revenue - total_cost) / max(0.01, total_cost)) * 100, 1)
-        rpe = round(total_revenue / max(1, total_sends), 4)
+        total_cost = _round2(total_sends * cost_per_send)
+        total_revenue = _round2(conversions * aov)
+        roi = _round1(((total_revenue - total_cost) / max(0.01, total_cost)) * 100)
+        rpe = _round4(total_revenue / max(1, total_sends))
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "sequence_roi",
-                "sequence_roi_pct": roi,
-                "total_revenue": total_revenue,
-                "total_cost": total_cost,
-                "net_profit": round(total_revenue - total_cost, 2),
-                "revenue_per_email": rpe,
-                "total_sends": total_sends,
-                "conversions": conversions,
-                "rating": "Excellent" if roi >= 500 else "Good" if roi >= 200 else "Acceptable" if roi >= 50 else "Needs improvement",
-            },
+            data=SequenceROIResult(
+                sequence_roi_pct=roi,
+                total_revenue=total_revenue,
+                total_cost=total_cost,
+                net_profit=_round2(total_revenue - total_cost),
+                revenue_per_email=rpe,
+                total_sends=total_sends,
+                conversions=conversions,
+                rating="Excellent" if roi >= 500 else "Good" if roi >= 200 else "Acceptable" if roi >= 50 else "Needs improvement",
+            ),
             tool_name=self.name,
         )
 
@@ -1423,7 +2022,96 @@ class EmailCampaignManagerTool(BaseTool):
 # 6. Market Segmentation Tool
 # ---------------------------------------------------------------------------
 
-class MarketSegmentationTool(BaseTool):
+# Segment score deduction by competition_intensity; unknown values count as Medium.
+_COMPETITION_PENALTY = MappingProxyType({"Low": 0, "Medium": 10, "High": 20, "Extremely High": 35})
+
+
+def format_dollars(value: float) -> str:
+    """Short market-size label: ``$12.3M`` from $1M up, otherwise ``$450K``."""
+    return f"${value / 1_000_000:.1f}M" if value >= 1_000_000 else f"${value / 1_000:.0f}K"
+
+
+@dataclass(slots=True, frozen=True)
+class TAMResult(ResultData):
+    """Total addressable market; the formatted label is built on serialisation."""
+    calc_type: ClassVar[str] = "tam_estimate"
+    tam_dollars: float
+    total_companies: int
+    average_deal_value: float
+    note: str = "TAM = total revenue opportunity if you captured 100% of the market."
+
+    def to_dict(self) -> dict:
+        return {
+            "calc_type": self.calc_type,
+            "tam_dollars": self.tam_dollars,
+            "tam_formatted": format_dollars(self.tam_dollars),
+            "total_companies": self.total_companies,
+            "average_deal_value": self.average_deal_value,
+            "note": self.note,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class SAMResult(ResultData):
+    """Serviceable addressable market as a share of TAM."""
+    calc_type: ClassVar[str] = "sam_estimate"
+    sam_dollars: float
+    tam_dollars: float
+    serviceable_pct: float
+    note: str = "SAM = the portion of TAM your current GTM model can reach."
+
+    def to_dict(self) -> dict:
+        return {
+            "calc_type": self.calc_type,
+            "sam_dollars": self.sam_dollars,
+            "sam_formatted": format_dollars(self.sam_dollars),
+            "tam_dollars": self.tam_dollars,
+            "serviceable_pct": self.serviceable_pct,
+            "note": self.note,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class SOMResult(ResultData):
+    """Serviceable obtainable market and the customer count it implies."""
+    calc_type: ClassVar[str] = "som_estimate"
+    som_dollars: float
+    sam_dollars: float
+    obtainable_pct: float
+    target_customers: int
+    note: str = "SOM = realistic revenue target achievable with current resources in 3-5 years."
+
+    def to_dict(self) -> dict:
+        return {
+            "calc_type": self.calc_type,
+            "som_dollars": self.som_dollars,
+            "som_formatted": format_dollars(self.som_dollars),
+            "sam_dollars": self.sam_dollars,
+            "obtainable_pct": self.obtainable_pct,
+            "target_customers": self.target_customers,
+            "note": self.note,
+        }
+
+
+def _penetration_kernel(current_customers: int, total_companies: int) -> float:
+    """Market penetration (%) to 3 dp; ``total_companies`` is already >= 1."""
+    return round((current_customers / total_companies) * 100, 3)
+
+
+@lru_cache(maxsize=4096)
+def _segment_kernel(
+    growth: float, deal_cycle: float, comp_penalty: int, differentiation: float
+) -> tuple[float, float, float, float]:
+    """Segment attractiveness: (total, growth_score, cycle_score, diff_score)."""
+    growth_score = min(30, growth * 1.5)
+    cycle_score = max(0, 25 - deal_cycle / 10)
+    diff_score = differentiation * 2.0  # max 20
+    # 25-pt baseline attractiveness
+    total = round(25.0 + growth_score + cycle_score + diff_score - comp_penalty, 1)
+    return max(0, min(100, total)), growth_score, cycle_score, diff_score
+
+
+class MarketSegmentationTool(_ColumnBatchTool):
     """
     Estimates market sizing and segmentation opportunities.
 
@@ -1435,6 +2123,8 @@ class MarketSegmentationTool(BaseTool):
       - ideal_segment_score     : ICP segment attractiveness score
     """
 
+    __slots__ = ()
+
     name = "market_segmentation"
     description = (
         "Estimates TAM, SAM, and SOM for market sizing. Calculates market penetration rate "
@@ -1482,20 +2172,39 @@ class MarketSegmentationTool(BaseTool):
         "required": ["calc_type"],
     }
 
+    _DISPATCH: dict[str, str] = {
+        "tam_estimate": "_tam",
+        "sam_estimate": "_sam",
+        "som_estimate": "_som",
+        "market_penetration_rate": "_penetration",
+        "ideal_segment_score": "_segment_score",
+    }
+
+    # run_many() column-wise calc_types; see _ColumnBatchTool.
+    _BATCH_COLUMNS = {
+        "market_penetration_rate": (
+            "_penetration_result",
+            (("current_customers", int, 0), ("total_companies_in_market", int, 1)),
+        ),
+        "ideal_segment_score": (
+            "_segment_result",
+            (
+                ("segment_growth_rate_pct", float, 5),
+                ("avg_deal_cycle_days", float, 90),
+                ("competition_intensity", None, "Medium"),
+                ("differentiation_score", float, 5),
+            ),
+        ),
+    }
+
     def run(self, **kwargs: Any) -> ToolResult:
         calc_type = kwargs.get("calc_type", "")
+        method = self._DISPATCH.get(calc_type) if isinstance(calc_type, str) else None
+        if method is None:
+            return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
         try:
-            dispatch = {
-                "tam_estimate": self._tam,
-                "sam_estimate": self._sam,
-                "som_estimate": self._som,
-                "market_penetration_rate": self._penetration,
-                "ideal_segment_score": self._segment_score,
-            }
-            if calc_type not in dispatch:
-                return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
-            return dispatch[calc_type](**kwargs)
-        except Exception as exc:
+            return getattr(self, method)(**kwargs)
+        except _INPUT_ERRORS as exc:
             return ToolResult(success=False, error=str(exc), tool_name=self.name)
 
     def _tam(self, **kw) -> ToolResult:
@@ -1505,14 +2214,7 @@ class MarketSegmentationTool(BaseTool):
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "tam_estimate",
-                "tam_dollars": tam,
-                "tam_formatted": f"${tam / 1_000_000:.1f}M" if tam >= 1_000_000 else f"${tam / 1_000:.0f}K",
-                "total_companies": companies,
-                "average_deal_value": adv,
-                "note": "TAM = total revenue opportunity if you captured 100% of the market.",
-            },
+            data=TAMResult(tam_dollars=tam, total_companies=companies, average_deal_value=adv),
             tool_name=self.name,
         )
 
@@ -1525,14 +2227,7 @@ class MarketSegmentationTool(BaseTool):
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "sam_estimate",
-                "sam_dollars": sam,
-                "sam_formatted": f"${sam / 1_000_000:.1f}M" if sam >= 1_000_000 else f"${sam / 1_000:.0f}K",
-                "tam_dollars": round(tam, 2),
-                "serviceable_pct": serviceable_pct,
-                "note": "SAM = the portion of TAM your current GTM model can reach.",
-            },
+            data=SAMResult(sam_dollars=sam, tam_dollars=round(tam, 2), serviceable_pct=serviceable_pct),
             tool_name=self.name,
         )
 
@@ -1546,22 +2241,24 @@ class MarketSegmentationTool(BaseTool):
 
         return ToolResult(
             success=True,
-            data={
-                "calc_type": "som_estimate",
-                "som_dollars": som,
-                "som_formatted": f"${som / 1_000_000:.1f}M" if som >= 1_000_000 else f"${som / 1_000:.0f}K",
-                "sam_dollars": round(sam, 2),
-                "obtainable_pct": obtainable_pct,
-                "target_customers": round(companies * serviceable_pct / 100 * obtainable_pct / 100),
-                "note": "SOM = realistic revenue target achievable with current resources in 3-5 years.",
-            },
+            data=SOMResult(
+                som_dollars=som,
+                sam_dollars=round(sam, 2),
+                obtainable_pct=obtainable_pct,
+                target_customers=round(companies * serviceable_pct / 100 * obtainable_pct / 100),
+            ),
             tool_name=self.name,
         )
 
     def _penetration(self, **kw) -> ToolResult:
-        current = int(kw.get("current_customers", 0))
-        total = max(1, int(kw.get("total_companies_in_market", 1)))
-        penetration = round((current / total) * 100, 3)
+        return self._penetration_result(
+            int(kw.get("current_customers", 0)),
+            int(kw.get("total_companies_in_market", 1)),
+        )
+
+    def _penetration_result(self, current: int, total: int) -> ToolResult:
+        total = max(1, total)
+        penetration = _penetration_kernel(current, total)
 
         return ToolResult(
             success=True,
@@ -1581,19 +2278,19 @@ class MarketSegmentationTool(BaseTool):
         )
 
     def _segment_score(self, **kw) -> ToolResult:
-        growth = float(kw.get("segment_growth_rate_pct", 5))
-        deal_cycle = float(kw.get("avg_deal_cycle_days", 90))
-        competition = kw.get("competition_intensity", "Medium")
-        differentiation = min(10, max(0, float(kw.get("differentiation_score", 5))))
-
-        comp_penalty = {"Low": 0, "Medium": 10, "High": 20, "Extremely High": 35}.get(competition, 10)
-        growth_score = min(30, growth * 1.5)
-        cycle_score = max(0, 25 - deal_cycle / 10)
-        diff_score = differentiation * 2.0  # max 20
-        base_score = 25.0  # baseline attractiveness
+        return self._segment_result(
+            float(kw.get("segment_growth_rate_pct", 5)),
+            float(kw.get("avg_deal_cycle_days", 90)),
+            kw.get("competition_intensity", "Medium"),
+            float(kw.get("differentiation_score", 5)),
+        )
 
-        total = round(base_score + growth_score + cycle_score + diff_score - comp_penalty, 1)
-        total = max(0, min(100, total))
+    def _segment_result(
+        self, growth: float, deal_cycle: float, competition: Any, differentiation: float
+    ) -> ToolResult:
+        differentiation = min(10, max(0, differentiation))
+        comp_penalty = _COMPETITION_PENALTY.get(competition, 10)
+        total, growth_score, cycle_score, diff_score = _segment_kernel(growth, deal_cycle, comp_penalty, differentiation)
 
         return ToolResult(
             success=True,
@@ -1606,7 +2303,7 @@ class MarketSegmentationTool(BaseTool):
                     "deal_cycle_score": round(cycle_score, 1),
                     "differentiation_score": round(diff_score, 1),
                     "competition_penalty": -comp_penalty,
-                    "baseline": base_score,
+                    "baseline": 25.0,
                 },
                 "recommendation": (
                     "Prioritise this segment in next quarter's GTM plan."
@@ -1624,7 +2321,54 @@ class MarketSegmentationTool(BaseTool):
 # 7. ROI Calculator
 # ---------------------------------------------------------------------------
 
-class ROICalculatorTool(BaseTool):
+@lru_cache(maxsize=4096)
+def _calc_roi(investment: float, revenue: float, margin_pct: float = 100) -> tuple[float, float, float]:
+    """
+    Unrounded (gross_profit, net_profit, roi_pct) for one channel or the mix.
+
+    Callers round only the figures they put in the result payload.
+    """
+    margin = margin_pct / 100
+    gross_profit = revenue * margin
+    net_profit = gross_profit - investment
+    return gross_profit, net_profit, (net_profit / max(0.01, investment)) * 100
+
+
+def _opted_out(flag: Any) -> bool:
+    """
+    True when a boolean flag is off. Non-strings follow ``bool()`` like the
+    module's other flags; strings are read as written, so ``"false"`` is off.
+    """
+    if isinstance(flag, str):
+        return flag.strip().lower() in ("", "false", "0", "no", "off")
+    return not flag
+
+
+@lru_cache(maxsize=1024)
+def _mix_core(
+    rows: tuple[tuple[Any, float, float], ...], margin: float
+) -> tuple[tuple[tuple[Any, float, float, float], ...], int, int, float, float]:
+    """
+    Score ``(channel, investment, revenue)`` rows by ROI.
+
+    Returns the rows as ``(channel, investment, revenue, roi_pct)`` in
+    input order, the indices of the best and worst row, and total
+    investment and total revenue. Best is the first highest ROI and worst
+    the last lowest, matching the ends of a stable best-first sort. Cached
+    so agent retries of the same mix skip the scoring; callers build fresh
+    breakdown dicts from the tuples.
+    """
+    scored = tuple(
+        (channel, inv, rev, round(((rev * margin / 100 - inv) / max(0.01, inv)) * 100, 1))
+        for channel, inv, rev in rows
+    )
+    roi_at = [row[3] for row in scored].__getitem__
+    best = max(range(len(scored)), key=roi_at)
+    worst = min(reversed(range(len(scored))), key=roi_at)
+    return scored, best, worst, sum([row[1] for row in rows]), sum([row[2] for row in rows])
+
+
+class ROICalculatorTool(_ColumnBatchTool):
     """
     Calculates ROI across multiple marketing channels and investment types.
 
@@ -1638,6 +2382,8 @@ class ROICalculatorTool(BaseTool):
       - overall_marketing_mix_roi : Blended multi-channel ROI
     """
 
+    __slots__ = ()
+
     name = "roi_calculator"
     description = (
         "Calculates ROI for individual marketing channels (content, SEO, paid media, "
@@ -1688,43 +2434,73 @@ class ROICalculatorTool(BaseTool):
                 },
                 "description": "Array of channel investments for blended ROI calculation.",
             },
+            "include_sorted_breakdown": {
+                "type": "boolean",
+                "description": "Sort channel_breakdown by ROI, best first (default true); false keeps input order.",
+            },
         },
         "required": ["calc_type"],
     }
 
+    _DISPATCH: dict[str, str] = {
+        "marketing_roi": "_marketing_roi",
+        "content_roi": "_content_roi",
+        "seo_roi": "_seo_roi",
+        "paid_media_roi": "_paid_media_roi",
+        "influencer_roi": "_influencer_roi",
+        "event_roi": "_event_roi",
+        "overall_marketing_mix_roi": "_mix_roi",
+    }
+
+    # run_many() column-wise calc_types; see _ColumnBatchTool.
+    _BATCH_COLUMNS = {
+        "marketing_roi": (
+            "_marketing_roi_result",
+            (
+                ("investment", float, 0),
+                ("revenue_attributed", float, 0),
+                ("gross_margin_pct", float, 100),
+                ("time_period_months", int, 12),
+                ("attribution_model", None, "last_touch"),
+            ),
+        ),
+        "paid_media_roi": (
+            "_paid_media_result",
+            (("investment", float, 0), ("revenue_attributed", float, 0), ("gross_margin_pct", float, 70)),
+        ),
+    }
+
     def run(self, **kwargs: Any) -> ToolResult:
         calc_type = kwargs.get("calc_type", "")
+        method = self._DISPATCH.get(calc_type) if isinstance(calc_type, str) else None
+        if method is None:
+            return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
         try:
-            dispatch = {
-                "marketing_roi": self._marketing_roi,
-                "content_roi": self._content_roi,
-                "seo_roi": self._seo_roi,
-                "paid_media_roi": self._paid_media_roi,
-                "influencer_roi": self._influencer_roi,
-                "event_roi": self._event_roi,
-                "overall_marketing_mix_roi": self._mix_roi,
-            }
-            if calc_type not in dispatch:
-                return ToolResult(success=False, error=f"Unknown calc_type '{calc_type}'.", tool_name=self.name)
-            return dispatch[calc_type](**kwargs)
-        except Exception as exc:
+            return getattr(self, method)(**kwargs)
+        except _INPUT_ERRORS as exc:
             return ToolResult(success=False, error=str(exc), tool_name=self.name)
 
-    def _calc_roi(self, investment: float, revenue: float, margin_pct: float = 100) -> tuple:
-        margin = margin_pct / 100
-        gross_profit = revenue * margin
-        net_profit = gross_profit - investment
-        roi_pct = round((net_profit / max(0.01, investment)) * 100, 1)
-        return round(gross_profit, 2), round(net_profit, 2), roi_pct
-
     def _marketing_roi(self, **kw) -> ToolResult:
-        inv = float(kw.get("investment", 0))
-        rev = float(kw.get("revenue_attributed", 0))
-        margin = float(kw.get("gross_margin_pct", 100))
-        months = int(kw.get("time_period_months", 12))
-        attribution = kw.get("attribution_model", "last_touch")
+        return self._marketing_roi_result(
+            float(kw.get("investment", 0)),
+            float(kw.get("revenue_attributed", 0)),
+            float(kw.get("gross_margin_pct", 100)),
+            int(kw.get("time_period_months", 12)),
+            kw.get("attribution_model", "last_touch"),
+        )
 
-        gross_profit, net_profit, roi = self._calc_roi(inv, rev, margin)
+    def _marketing_roi_result(
+        self, inv: float, rev: float, margin: float, months: int, attribution: Any
+    ) -> ToolResult:
+        if months == 0:
+            return ToolResult(
+                success=False,
+                error="time_period_months must be non-zero to calculate monthly ROI.",
+                tool_name=self.name,
+            )
+
+        gross_profit, net_profit, roi = _calc_roi(inv, rev, margin)
+        roi = round(roi, 1)
         monthly_roi = round(roi / months, 1)
 
         return ToolResult(
@@ -1733,8 +2509,8 @@ class ROICalculatorTool(BaseTool):
                 "calc_type": "marketing_roi",
                 "roi_pct": roi,
                 "monthly_roi_pct": monthly_roi,
-                "net_profit": net_profit,
-                "gross_profit": gross_profit,
+                "net_profit": round(net_profit, 2),
+                "gross_profit": round(gross_profit, 2),
                 "investment": inv,
                 "revenue_attributed": rev,
                 "time_period_months": months,
@@ -1751,14 +2527,15 @@ class ROICalculatorTool(BaseTool):
         margin = float(kw.get("gross_margin_pct", 100))
         months = int(kw.get("time_period_months", 12))
 
-        _, net_profit, roi = self._calc_roi(inv, rev, margin)
+        _, net_profit, roi = _calc_roi(inv, rev, margin)
+        net_profit = round(net_profit, 2)
         roi_per_piece = round(net_profit / pieces, 2)
 
         return ToolResult(
             success=True,
             data={
                 "calc_type": "content_roi",
-                "roi_pct": roi,
+                "roi_pct": round(roi, 1),
                 "net_profit": net_profit,
                 "cost_per_piece": round(inv / pieces, 2),
                 "roi_per_content_piece": roi_per_piece,
@@ -1782,14 +2559,14 @@ class ROICalculatorTool(BaseTool):
 
         monthly_revenue = traffic_increase * conv_rate * aov
         total_revenue = monthly_revenue * months
-        _, net_profit, roi = self._calc_roi(inv, total_revenue, margin)
+        _, net_profit, roi = _calc_roi(inv, total_revenue, margin)
 
         return ToolResult(
             success=True,
             data={
                 "calc_type": "seo_roi",
-                "roi_pct": roi,
-                "net_profit": net_profit,
+                "roi_pct": round(roi, 1),
+                "net_profit": round(net_profit, 2),
                 "monthly_organic_revenue": round(monthly_revenue, 2),
                 "total_attributed_revenue": round(total_revenue, 2),
                 "investment": inv,
@@ -1801,22 +2578,32 @@ class ROICalculatorTool(BaseTool):
         )
 
     def _paid_media_roi(self, **kw) -> ToolResult:
-        inv = float(kw.get("investment", 0))
-        rev = float(kw.get("revenue_attributed", 0))
-        margin = float(kw.get("gross_margin_pct", 70))
+        return self._paid_media_result(
+            float(kw.get("investment", 0)),
+            float(kw.get("revenue_attributed", 0)),
+            float(kw.get("gross_margin_pct", 70)),
+        )
+
+    def _paid_media_result(self, inv: float, rev: float, margin: float) -> ToolResult:
+        if margin == 0:
+            return ToolResult(
+                success=False,
+                error="gross_margin_pct must be non-zero to calculate breakeven ROAS.",
+                tool_name=self.name,
+            )
 
         roas = round(rev / max(0.01, inv), 2)
-        _, net_profit, roi = self._calc_roi(inv, rev, margin)
+        _, net_profit, roi = _calc_roi(inv, rev, margin)
         breakeven_roas = round(100 / margin, 2)
 
         return ToolResult(
             success=True,
             data={
                 "calc_type": "paid_media_roi",
-                "roi_pct": roi,
+                "roi_pct": round(roi, 1),
                 "roas": roas,
                 "breakeven_roas": breakeven_roas,
-                "net_profit": net_profit,
+                "net_profit": round(net_profit, 2),
                 "investment": inv,
                 "revenue": rev,
                 "recommendation": (
@@ -1836,14 +2623,14 @@ class ROICalculatorTool(BaseTool):
         margin = float(kw.get("gross_margin_pct", 70))
 
         cpm = round((inv / reach) * 1000, 2)
-        _, net_profit, roi = self._calc_roi(inv, rev, margin)
+        _, net_profit, roi = _calc_roi(inv, rev, margin)
 
         return ToolResult(
             success=True,
             data={
                 "calc_type": "influencer_roi",
-                "roi_pct": roi,
-                "net_profit": net_profit,
+                "roi_pct": round(roi, 1),
+                "net_profit": round(net_profit, 2),
                 "cpm_cost": cpm,
                 "influencer_reach": reach,
                 "investment": inv,
@@ -1862,14 +2649,14 @@ class ROICalculatorTool(BaseTool):
 
         cost_per_attendee = round(inv / attendees, 2)
         cost_per_lead = round(inv / max(1, leads), 2)
-        _, net_profit, roi = self._calc_roi(inv, rev, margin)
+        _, net_profit, roi = _calc_roi(inv, rev, margin)
 
         return ToolResult(
             success=True,
             data={
                 "calc_type": "event_roi",
-                "roi_pct": roi,
-                "net_profit": net_profit,
+                "roi_pct": round(roi, 1),
+                "net_profit": round(net_profit, 2),
                 "cost_per_attendee": cost_per_attendee,
                 "cost_per_lead": cost_per_lead,
                 "leads_generated": leads,
@@ -1885,50 +2672,50 @@ class ROICalculatorTool(BaseTool):
         channels: list = kw.get("channel_investments", [])
         margin = float(kw.get("gross_margin_pct", 70))
 
-        if not channels:
+        if not channels or not all(isinstance(c, Mapping) for c in channels):
             return ToolResult(
                 success=False,
                 error="Provide 'channel_investments' array with channel, investment, and revenue for each channel.",
                 tool_name=self.name,
             )
 
-        total_inv = sum(float(c.get("investment", 0)) for c in channels)
-        total_rev = sum(float(c.get("revenue", 0)) for c in channels)
-        _, net_profit, blended_roi = self._calc_roi(total_inv, total_rev, margin)
-
-        channel_details = sorted(
-            [
-                {
-                    "channel": c.get("channel", "Unknown"),
-                    "investment": float(c.get("investment", 0)),
-                    "revenue": float(c.get("revenue", 0)),
-                    "roi_pct": round(
-                        ((float(c.get("revenue", 0)) * margin / 100 - float(c.get("investment", 0))) /
-                         max(0.01, float(c.get("investment", 0)))) * 100, 1
-                    ),
-                }
-                for c in channels
-            ],
-            key=lambda x: x["roi_pct"],
-            reverse=True,
+        rows = tuple(
+            (c.get("channel", "Unknown"), float(c.get("investment", 0)), float(c.get("revenue", 0)))
+            for c in channels
         )
+        try:
+            scored, best, worst, total_inv, total_rev = _mix_core(rows, margin)
+        except TypeError:  # unhashable channel label — score without the cache
+            scored, best, worst, total_inv, total_rev = _mix_core.__wrapped__(rows, margin)
+        _, net_profit, blended_roi = _calc_roi(total_inv, total_rev, margin)
+
+        # Top / worst come straight from the scored rows; only the display
+        # breakdown needs the full sort, and callers can opt out of it.
+        top_channel, _, _, top_roi = scored[best]
+        worst_channel, _, _, worst_roi = scored[worst]
+        if not _opted_out(kw.get("include_sorted_breakdown", True)):
+            scored = sorted(scored, key=itemgetter(3), reverse=True)
+        channel_details = [
+            {"channel": channel, "investment": inv, "revenue": rev, "roi_pct": roi_pct}
+            for channel, inv, rev, roi_pct in scored
+        ]
 
         return ToolResult(
             success=True,
             data={
                 "calc_type": "overall_marketing_mix_roi",
-                "blended_roi_pct": blended_roi,
+                "blended_roi_pct": round(blended_roi, 1),
                 "total_investment": round(total_inv, 2),
                 "total_revenue": round(total_rev, 2),
-                "net_profit": net_profit,
+                "net_profit": round(net_profit, 2),
                 "channel_breakdown": channel_details,
-                "top_performing_channel": channel_details[0]["channel"] if channel_details else "N/A",
-                "worst_performing_channel": channel_details[-1]["channel"] if channel_details else "N/A",
+                "top_performing_channel": top_channel,
+                "worst_performing_channel": worst_channel,
                 "optimisation_tip": (
-                    f"Reallocate budget from '{channel_details[-1]['channel']}' "
-                    f"(ROI: {channel_details[-1]['roi_pct']}%) to "
-                    f"'{channel_details[0]['channel']}' "
-                    f"(ROI: {channel_details[0]['roi_pct']}%) for higher blended returns."
+                    f"Reallocate budget from '{worst_channel}' "
+                    f"(ROI: {worst_roi}%) to "
+                    f"'{top_channel}' "
+                    f"(ROI: {top_roi}%) for higher blended returns."
                 ) if len(channel_details) >= 2 else "Add more channels for mix optimisation.",
             },
             tool_name=self.name,
@@ -1939,30 +2726,38 @@ class ROICalculatorTool(BaseTool):
 # Registry
 # ---------------------------------------------------------------------------
 
+# Tool classes by name; instances are created on first lookup and reused.
+_TOOL_FACTORIES: dict[str, type[BaseTool]] = {}
 _TOOLS: dict[str, BaseTool] = {}
 
 
-def _register(tool: BaseTool) -> None:
-    _TOOLS[tool.name] = tool
+def _register(tool_cls: type[BaseTool]) -> None:
+    _TOOL_FACTORIES[tool_cls.name] = tool_cls
 
 
 def get_tool(name: str) -> BaseTool | None:
-    return _TOOLS.get(name)
+    tool = _TOOLS.get(name)
+    if tool is None:
+        factory = _TOOL_FACTORIES.get(name)
+        if factory is None:
+            return None
+        tool = _TOOLS[name] = factory()
+    return tool
 
 
 def list_tools() -> list[str]:
-    return sorted(_TOOLS.keys())
+    return sorted(_TOOL_FACTORIES.keys())
 
 
 def all_tools() -> list[BaseTool]:
-    return list(_TOOLS.values())
+    return [get_tool(name) for name in _TOOL_FACTORIES]
 
 
-# Auto-register all tools at import time
-_register(LeadScoringCalcTool())
-_register(CampaignAnalyticsCalcTool())
-_register(ContentOptimizerTool())
-_register(SEOAnalyzerTool())
-_register(EmailCampaignManagerTool())
-_register(MarketSegmentationTool())
-_register(ROICalculatorTool())
+# Register all tool classes at import time; instantiation is deferred
+_register(LeadScoringCalcTool)
+_register(CampaignAnalyticsCalcTool)
+_register(ContentOptimizerTool)
+_register(SEOAnalyzerTool)
+_register(EmailCampaignManagerTool)
+_register(MarketSegmentationTool)
+_register(ROICalculatorTool)
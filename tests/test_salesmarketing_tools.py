@@ -0,0 +1,386 @@
+"""Behaviour tests for the Sales & Marketing calculation tools."""
+import json
+
+import pytest
+
+from nanobot.tools.salesmarketing_tools import (
+    CampaignAnalyticsCalcTool,
+    ContentOptimizerTool,
+    EmailCampaignManagerTool,
+    LeadScoringCalcTool,
+    MarketSegmentationTool,
+    ROICalculatorTool,
+    SEOAnalyzerTool,
+    format_dollars,
+)
+
+
+def test_bant_gaps_report_only_weak_components():
+    tool = LeadScoringCalcTool()
+    result = tool.run(
+        calc_type="bant_qualify",
+        budget_range=">$1M",
+        title_seniority="Individual Contributor",
+        pain_score=9,
+        timeline_months=24,
+    )
+    assert result.success
+    assert result.data.gaps == ("Economic buyer confirmed", "Active buying timeline")
+
+
+def test_meddic_risks_report_only_weak_components():
+    tool = LeadScoringCalcTool()
+    strong = tool.run(
+        calc_type="meddic_score",
+        pain_score=10,
+        decision_maker_confirmed=True,
+        champion_identified=True,
+        engagement_signals=20,
+    )
+    assert strong.data.risks == ()
+
+    weak = tool.run(calc_type="meddic_score", pain_score=2, engagement_signals=1)
+    assert weak.data.risks == (
+        "No economic buyer confirmed",
+        "Weak pain articulation",
+        "No internal champion",
+        "Unclear decision process",
+    )
+
+
+def test_dataclass_payload_serialises_as_dict():
+    tool = LeadScoringCalcTool()
+    result = tool.run(calc_type="ilt_score", company_size=200, title_seniority="VP", engagement_signals=4)
+    payload = result.payload()
+    assert payload["calc_type"] == "ilt_score"
+    assert payload["ilt_score"] == result.data.score
+    assert payload["breakdown"]["firmographic_fit_40pts"] == 40.0
+    assert result.to_anthropic()["content"] == str(payload)
+
+
+def test_run_batch_matches_scalar_scoring():
+    tool = LeadScoringCalcTool()
+    columns = {
+        "company_size": [5, 200, 10000],
+        "title_seniority": ["Unknown", "VP", "C-Suite"],
+        "engagement_signals": [0, 12, 600],
+        "budget_range": ["<$10k", "$50k-$200k", ">$1M"],
+        "pain_score": [1, 7, 12],
+        "timeline_months": [24, 3, 1],
+    }
+    ilt, bant, tiers = tool.run_batch(columns)
+
+    tier_labels = ["D — Unqualified", "C — Cool", "B — Warm", "A — Hot"]
+    for i in range(3):
+        row = {name: values[i] for name, values in columns.items()}
+        ilt_result = tool.run(calc_type="ilt_score", **row).data
+        bant_result = tool.run(calc_type="bant_qualify", **row).data
+        assert ilt[i] == ilt_result.score
+        assert bant[i] == bant_result.total
+        assert tier_labels[tiers[i]] == ilt_result.tier
+
+
+def test_invalid_inputs_return_error_results():
+    assert not LeadScoringCalcTool().run(calc_type="ilt_score", company_size="lots").success
+    assert not LeadScoringCalcTool().run(calc_type=["ilt_score"]).success
+
+    roas = CampaignAnalyticsCalcTool().run(calc_type="roas", ad_spend=100, gross_margin_pct=0)
+    assert not roas.success
+    assert "gross_margin_pct" in roas.error
+
+
+def test_run_many_matches_scalar_run():
+    tool = ContentOptimizerTool()
+    records = [
+        {"word_count": 1000, "keyword_count": 3},
+        {"word_count": 200, "keyword_count": 9},
+        {"meta_title_length": 55, "meta_description_length": 130, "meta_title_has_keyword": True},
+        {"word_count": "many"},
+    ]
+    for calc_type in ("keyword_density", "meta_score", "readability_score"):
+        batch = tool.run_many(calc_type, records)
+        scalar = [tool.run(calc_type=calc_type, **r) for r in records]
+        assert [r.success for r in batch] == [r.success for r in scalar]
+        assert [r.payload() for r in batch] == [r.payload() for r in scalar]
+
+
+def test_flat_result_payload_keeps_dict_layout():
+    result = ContentOptimizerTool().run(calc_type="meta_score", meta_title_length=55, meta_description_length=130)
+    assert result.data["meta_score"] == 75
+    assert list(result.payload()) == [
+        "calc_type", "meta_score", "rating", "issues", "title_length", "description_length", "keyword_in_title",
+    ]
+    assert result.payload()["issues"] == ["Primary keyword missing from meta title — add it near the front."]
+
+
+def test_score_meta_batch_matches_scalar_meta_score():
+    tool = ContentOptimizerTool()
+    titles, descs, keywords = [55, 45, 90, 0], [130, 165, 30, 155], [True, False, True, False]
+    scores = tool.score_meta_batch(titles, descs, keywords)
+    for title, desc, keyword, score in zip(titles, descs, keywords, scores):
+        result = tool.run(
+            calc_type="meta_score",
+            meta_title_length=title,
+            meta_description_length=desc,
+            meta_title_has_keyword=keyword,
+        )
+        assert result.data.meta_score == score
+
+
+def test_score_deliverability_batch_matches_scalar_score():
+    tool = EmailCampaignManagerTool()
+    bounces, spams = [0.2, 1.5, 4.0, 9.0], [0.05, 0.1, 0.5, 0.08]
+    flags = [(True, True, True), (True, False, True), (False, False, False), (False, True, False)]
+    scores = tool.score_deliverability_batch(bounces, spams, [sum(f) for f in flags])
+    for bounce, spam, (spf, dkim, dmarc), score in zip(bounces, spams, flags, scores):
+        result = tool.run(
+            calc_type="deliverability_score",
+            bounce_rate_pct=bounce,
+            spam_complaint_rate_pct=spam,
+            has_spf=spf,
+            has_dkim=dkim,
+            has_dmarc=dmarc,
+        )
+        assert result.data.deliverability_score == score
+
+
+def test_mix_roi_breakdown_is_fresh_per_call():
+    tool = ROICalculatorTool()
+    channels = [
+        {"channel": "SEO", "investment": 1000, "revenue": 9000},
+        {"channel": "Paid", "investment": 5000, "revenue": 6000},
+    ]
+    first = tool.run(calc_type="overall_marketing_mix_roi", channel_investments=channels)
+    first.data["channel_breakdown"][0]["roi_pct"] = -1
+    second = tool.run(calc_type="overall_marketing_mix_roi", channel_investments=channels)
+    assert second.data["channel_breakdown"][0] == {"channel": "SEO", "investment": 1000.0, "revenue": 9000.0, "roi_pct": 530.0}
+
+    unhashable = tool.run(
+        calc_type="overall_marketing_mix_roi",
+        channel_investments=[{"channel": ["SEO"], "investment": 1000, "revenue": 9000}],
+    )
+    assert unhashable.success
+
+
+def test_schemas_are_built_once_per_class():
+    first, second = ROICalculatorTool(), ROICalculatorTool()
+    cached = ROICalculatorTool.__dict__["_anthropic_schema"]
+    assert first.to_anthropic_schema() == second.to_anthropic_schema() == cached
+    assert ROICalculatorTool.__dict__["_anthropic_schema"] is cached
+    assert first.to_openai_schema()["function"]["name"] == "roi_calculator"
+    assert LeadScoringCalcTool().to_anthropic_schema()["name"] != first.to_anthropic_schema()["name"]
+
+
+def test_schemas_are_built_from_class_attributes_at_definition():
+    class ProbeTool(ROICalculatorTool):
+        name = "probe"
+
+    assert "_anthropic_schema" in ProbeTool.__dict__
+    assert ProbeTool().to_anthropic_schema()["name"] == "probe"
+    assert ProbeTool().to_openai_schema()["function"]["parameters"] == ROICalculatorTool.parameters_schema
+    assert ROICalculatorTool().to_anthropic_schema()["name"] == "roi_calculator"
+
+
+def test_mutating_a_returned_schema_does_not_leak():
+    tool = ROICalculatorTool()
+    anthropic = tool.to_anthropic_schema()
+    anthropic["cache_control"] = {"type": "ephemeral"}
+    anthropic["input_schema"]["required"].append("investment")
+    openai = tool.to_openai_schema()
+    openai["function"]["parameters"]["properties"].clear()
+
+    fresh = ROICalculatorTool().to_anthropic_schema()
+    assert "cache_control" not in fresh
+    assert fresh["input_schema"]["required"] == ["calc_type"]
+    assert tool.to_openai_schema()["function"]["parameters"]["properties"]
+    assert ROICalculatorTool.parameters_schema["required"] == ["calc_type"]
+
+
+def test_segment_and_roi_run_many_match_scalar_run():
+    cases = [
+        (MarketSegmentationTool(), "ideal_segment_score", [
+            {"segment_growth_rate_pct": 12, "competition_intensity": "High", "differentiation_score": 14},
+            {"avg_deal_cycle_days": 30, "competition_intensity": "Unknown"},
+        ]),
+        (MarketSegmentationTool(), "market_penetration_rate", [
+            {"current_customers": 40, "total_companies_in_market": 1000},
+            {"current_customers": 3},
+        ]),
+        (ROICalculatorTool(), "paid_media_roi", [
+            {"investment": 1000, "revenue_attributed": 5000},
+            {"investment": 1000, "revenue_attributed": 5000, "gross_margin_pct": 0},
+        ]),
+    ]
+    for tool, calc_type, records in cases:
+        batch = tool.run_many(calc_type, records)
+        scalar = [tool.run(calc_type=calc_type, **r) for r in records]
+        assert [(r.success, r.payload()) for r in batch] == [(r.success, r.payload()) for r in scalar]
+
+
+def test_mix_roi_unsorted_breakdown_keeps_top_and_worst():
+    tool = ROICalculatorTool()
+    channels = [
+        {"channel": "Events", "investment": 1000, "revenue": 1000},
+        {"channel": "SEO", "investment": 1000, "revenue": 9000},
+        {"channel": "Social", "investment": 1000, "revenue": 1000},
+        {"channel": "Email", "investment": 1000, "revenue": 9000},
+    ]
+    ranked = tool.run(calc_type="overall_marketing_mix_roi", channel_investments=channels).data
+    unsorted = tool.run(
+        calc_type="overall_marketing_mix_roi", channel_investments=channels, include_sorted_breakdown=False
+    ).data
+    assert [c["channel"] for c in ranked["channel_breakdown"]] == ["SEO", "Email", "Events", "Social"]
+    assert [c["channel"] for c in unsorted["channel_breakdown"]] == ["Events", "SEO", "Social", "Email"]
+    for data in (ranked, unsorted):
+        assert (data["top_performing_channel"], data["worst_performing_channel"]) == ("SEO", "Social")
+    assert unsorted["optimisation_tip"] == ranked["optimisation_tip"]
+
+
+def test_mix_roi_sort_flag_uses_one_truthiness_rule():
+    tool = ROICalculatorTool()
+    channels = [
+        {"channel": "Paid", "investment": 1000, "revenue": 1000},
+        {"channel": "SEO", "investment": 1000, "revenue": 9000},
+    ]
+    unsorted, ranked = ["Paid", "SEO"], ["SEO", "Paid"]
+    cases = [(flag, unsorted) for flag in ("false", "False", "0", 0, False, None)]
+    cases += [(flag, ranked) for flag in ("true", "1", 1, True)]
+    for flag, order in cases:
+        data = tool.run(calc_type="overall_marketing_mix_roi", channel_investments=channels, include_sorted_breakdown=flag).data
+        assert [c["channel"] for c in data["channel_breakdown"]] == order
+
+
+def test_market_size_labels_are_formatted_on_serialisation():
+    tool = MarketSegmentationTool()
+    tam = tool.run(calc_type="tam_estimate", total_companies_in_market=5000, average_deal_value=25000).data
+    assert tam.tam_dollars == 125_000_000
+    assert tam["tam_formatted"] == format_dollars(tam.tam_dollars) == "$125.0M"
+    som = tool.run(calc_type="som_estimate", total_companies_in_market=100, average_deal_value=1000).data
+    assert list(som.to_dict())[:3] == ["calc_type", "som_dollars", "som_formatted"]
+    assert format_dollars(450_000) == "$450K"
+    for calc_type in ("tam_estimate", "sam_estimate", "som_estimate"):
+        data = tool.run(calc_type=calc_type).data
+        assert data.calc_type == calc_type == data["calc_type"]
+
+
+def test_roi_zero_denominators_return_error_results():
+    tool = ROICalculatorTool()
+    paid = tool.run(calc_type="paid_media_roi", investment=1000, revenue_attributed=5000, gross_margin_pct=0)
+    assert not paid.success and "gross_margin_pct" in paid.error
+    monthly = tool.run(calc_type="marketing_roi", investment=1000, revenue_attributed=5000, time_period_months=0)
+    assert not monthly.success and "time_period_months" in monthly.error
+    assert not tool.run(calc_type="overall_marketing_mix_roi", channel_investments=["SEO"]).success
+
+
+def test_item_access_reads_fields_and_copies_inner_dicts():
+    tool = EmailCampaignManagerTool()
+    data = tool.run(calc_type="deliverability_score", has_spf=True, has_dkim=True, has_dmarc=False).data
+    data["authentication"]["DMARC"] = True
+    data.to_dict()["authentication"]["DMARC"] = True
+    assert data.authentication["DMARC"] is False
+    assert data["issues"] == list(data.issues)
+
+    tam = MarketSegmentationTool().run(calc_type="tam_estimate", total_companies_in_market=10, average_deal_value=500).data
+    assert (tam["tam_dollars"], tam["tam_formatted"]) == (5000, "$5K")
+    bant = LeadScoringCalcTool().run(calc_type="bant_qualify").data
+    assert bant["bant_total_score"] == bant.total
+    with pytest.raises(KeyError):
+        bant["total"]
+
+
+def test_content_gap_rejects_non_iterable_targets():
+    tool = ContentOptimizerTool()
+    for target in (None, 0):
+        assert not tool.run(calc_type="content_gap_analysis", target_keywords=target).success
+    empty = tool.run(calc_type="content_gap_analysis", target_keywords=[])
+    assert empty.success and empty.data["action"] == "All target topics are covered."
+
+
+def test_non_finite_inputs_round_like_builtin_round():
+    roas = CampaignAnalyticsCalcTool().run(calc_type="roas", ad_spend=100, revenue_attributed=1e309)
+    assert roas.success
+    assert roas.data["roas"] == float("inf")
+    readability = ContentOptimizerTool().run(calc_type="readability_score", avg_sentence_length=float("nan"))
+    assert readability.success
+
+
+def test_meddic_capped_proxies_serialise_as_ints():
+    result = LeadScoringCalcTool().run(calc_type="meddic_score", pain_score=10, engagement_signals=20)
+    breakdown = result.payload()["breakdown"]
+    assert "'Decision_Criteria': 17, 'Decision_Process': 17," in str(breakdown)
+
+
+def test_lead_results_carry_their_calc_type():
+    tool = LeadScoringCalcTool()
+    for calc_type in ("ilt_score", "bant_qualify", "meddic_score"):
+        data = tool.run(calc_type=calc_type).data
+        assert data.calc_type == calc_type == data.to_dict()["calc_type"]
+
+
+def test_nan_inputs_take_the_fallthrough_band():
+    campaign = CampaignAnalyticsCalcTool()
+    assert campaign.run(calc_type="roas", ad_spend=100, revenue_attributed=float("nan")).data["rating"] == "Negative ROI"
+    assert campaign.run(calc_type="roas", ad_spend="inf", revenue_attributed="inf").data["rating"] == "Negative ROI"
+    assert campaign.run(calc_type="roas", ad_spend=100, revenue_attributed="inf").data["rating"] == "Excellent"
+
+    lead = LeadScoringCalcTool()
+    bant = lead.run(calc_type="bant_qualify", timeline_months=float("nan")).data
+    assert bant.timeline == 3.0 and "Active buying timeline" in bant.gaps
+    assert lead.run(calc_type="bant_qualify", timeline_months=float("-inf")).data.timeline == 25.0
+
+
+def test_nan_payback_rates_as_needs_improvement():
+    result = CampaignAnalyticsCalcTool().run(calc_type="payback_period", ad_spend="inf", average_order_value="inf")
+    assert result.success
+    assert result.data["rating"] == "Needs improvement"
+
+
+def test_monthly_gross_profit_keeps_baseline_rounding():
+    result = CampaignAnalyticsCalcTool().run(
+        calc_type="payback_period",
+        ad_spend=100,
+        average_order_value=105.25,
+        average_purchase_frequency=2,
+        gross_margin_pct=60,
+    )
+    # (105.25 * 2 / 12) * 0.6 rounds to 10.53; folding 1/12 into a constant gave 10.52.
+    assert result.data["monthly_gross_profit_per_customer"] == 10.53
+
+
+def test_dataclass_payload_behaves_as_a_read_only_mapping():
+    result = ContentOptimizerTool().run(calc_type="meta_score", meta_title_length=55, meta_description_length=130)
+    data = result.data
+    assert "rating" in data and "missing" not in data
+    assert data.get("rating") == "Good" and data.get("missing", 0) == 0
+    assert dict(data) == result.payload()
+    assert list(data) == list(data.keys()) == list(result.payload())
+    assert len(data) == 7
+    assert json.loads(json.dumps(dict(data))) == json.loads(json.dumps(result.payload()))
+
+
+def test_nan_deliverability_rates_score_as_critical():
+    result = EmailCampaignManagerTool().run(
+        calc_type="deliverability_score",
+        bounce_rate_pct="nan",
+        spam_complaint_rate_pct="nan",
+        has_spf=True,
+        has_dkim=True,
+        has_dmarc=True,
+    )
+    assert result.data.deliverability_score == 35.0
+    assert result.data.rating == "Critical"
+    assert [issue.split(" ", 1)[0] for issue in result.data.issues[-2:]] == ["Critical", "Spam"]
+
+
+def test_score_deliverability_batch_clips_auth_counts():
+    tool = EmailCampaignManagerTool()
+    assert tool.score_deliverability_batch([0.1, 0.1, "nan"], [0.01, 0.01, "nan"], [5, -2, 3]) == [100.0, 70.0, 35.0]
+
+
+def test_domain_authority_caps_serialise_as_ints():
+    result = SEOAnalyzerTool().run(
+        calc_type="domain_authority_estimate", domain_age_years=50, referring_domains=10**6, total_backlinks=10**6
+    )
+    assert "'age_contribution': 20, 'referring_domains_contribution': 50, 'backlinks_contribution': 30," in str(
+        result.payload()
+    )